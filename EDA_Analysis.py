@@ -1,564 +1,518 @@
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
-from scipy.stats import chi2_contingency
-import warnings
-warnings.filterwarnings('ignore')
-
-"""
-COMPREHENSIVE EXPLORATORY DATA ANALYSIS (EDA)
-==============================================
-Rwanda DHS: Early Sexual Debut and Early Pregnancy Risk Factors
-
-Analysis Structure:
-1. Univariate Analysis (Distribution of all variables)
-2. Bivariate Analysis (Associations with outcomes)
-3. Multivariate Exploration (Interactions and patterns)
-4. Statistical Tests (Chi-square, t-tests, ANOVA)
-5. Visualizations (Publication-ready figures)
-"""
-
-# Set style for professional visualizations
-sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (12, 8)
-plt.rcParams['font.size'] = 10
-
-# Load data
-print("="*80)
-print("COMPREHENSIVE EXPLORATORY DATA ANALYSIS")
-print("Early Sexual Debut and Early Pregnancy Risk - Rwanda DHS 2019-20")
-print("="*80)
-
-data = pd.read_csv('rwanda_dhs_CLEANED_minimal.csv')
-print(f"\nDataset: {len(data):,} women aged 15-49 years")
-print(f"Variables: {data.shape[1]} total")
-
-# ============================================================================
-# PART 1: UNIVARIATE ANALYSIS - OUTCOME VARIABLES
-# ============================================================================
-
-print("\n" + "="*80)
-print("PART 1: UNIVARIATE ANALYSIS - PRIMARY OUTCOMES")
-print("="*80)
-
-# 1.1 Sexual Debut Status (All Women)
-print("\n" + "-"*80)
-print("1.1 SEXUAL DEBUT STATUS (N = 14,530)")
-print("-"*80)
-
-debut_distribution = data['sexual_debut_category'].value_counts()
-debut_pct = (debut_distribution / len(data) * 100).round(2)
-
-print("\n📊 Distribution:")
-for category in ['Never had sex', 'Early debut (<18)', 'Normal/Late debut (≥18)']:
-    count = debut_distribution.get(category, 0)
-    pct = debut_pct.get(category, 0)
-    print(f"  {category:30s}: {count:6,} ({pct:6.2f}%)")
-
-print(f"\n✓ Among all women:")
-print(f"  - {debut_pct.get('Early debut (<18)', 0):.1f}% experienced early sexual debut")
-print(f"  - {debut_pct.get('Never had sex', 0):.1f}% have never had sexual intercourse")
-
-# 1.2 Early Sexual Debut (Among Sexually Active Only)
-print("\n" + "-"*80)
-print("1.2 EARLY SEXUAL DEBUT - AMONG SEXUALLY ACTIVE WOMEN")
-print("-"*80)
-
-has_sex = (data['v525'] > 0) & (data['v525'] < 50)
-n_sexually_active = has_sex.sum()
-
-early_debut_rate = data.loc[has_sex, 'early_sexual_debut'].mean() * 100
-very_early_rate = data.loc[has_sex, 'very_early_debut'].mean() * 100
-
-print(f"\nSample size: {n_sexually_active:,} women")
-print(f"\n📊 Prevalence:")
-print(f"  Early sexual debut (<18 years):      {early_debut_rate:.2f}%")
-print(f"  Very early debut (<15 years):        {very_early_rate:.2f}%")
-
-# Age at first sex distribution
-age_first_sex = data.loc[has_sex, 'v525']
-print(f"\n📊 Age at First Sexual Intercourse:")
-print(f"  Mean:   {age_first_sex.mean():.2f} years (SD: {age_first_sex.std():.2f})")
-print(f"  Median: {age_first_sex.median():.0f} years")
-print(f"  Range:  {age_first_sex.min():.0f} - {age_first_sex.max():.0f} years")
-print(f"  IQR:    Q1={age_first_sex.quantile(0.25):.0f}, Q3={age_first_sex.quantile(0.75):.0f}")
-
-# Distribution by age categories
-age_categories = pd.cut(age_first_sex, bins=[0, 15, 18, 20, 25, 50], 
-                        labels=['<15', '15-17', '18-19', '20-24', '25+'])
-print(f"\n📊 Age distribution:")
-age_dist = age_categories.value_counts().sort_index()
-for age_cat, count in age_dist.items():
-    pct = count / len(age_first_sex) * 100
-    print(f"  {age_cat:10s}: {count:5,} ({pct:5.2f}%)")
-
-# 1.3 Early First Birth (Among Women Who Gave Birth)
-print("\n" + "-"*80)
-print("1.3 EARLY FIRST BIRTH - AMONG WOMEN WHO GAVE BIRTH")
-print("-"*80)
-
-has_birth = (data['v531'].notna()) & (data['v531'] > 0) & (data['v531'] < 50)
-n_mothers = has_birth.sum()
-
-early_birth_rate = data.loc[has_birth, 'early_first_birth'].mean() * 100
-teen_pregnancy_rate = data.loc[has_birth, 'teen_pregnancy'].mean() * 100
-
-print(f"\nSample size: {n_mothers:,} women")
-print(f"\n📊 Prevalence:")
-print(f"  Early first birth (<18 years):       {early_birth_rate:.2f}%")
-print(f"  Teen pregnancy (<20 years):          {teen_pregnancy_rate:.2f}%")
-
-# Age at first birth distribution
-age_first_birth = data.loc[has_birth, 'v531']
-print(f"\n📊 Age at First Birth:")
-print(f"  Mean:   {age_first_birth.mean():.2f} years (SD: {age_first_birth.std():.2f})")
-print(f"  Median: {age_first_birth.median():.0f} years")
-print(f"  Range:  {age_first_birth.min():.0f} - {age_first_birth.max():.0f} years")
-
-# ============================================================================
-# PART 2: UNIVARIATE ANALYSIS - EXPLANATORY VARIABLES
-# ============================================================================
-
-print("\n" + "="*80)
-print("PART 2: UNIVARIATE ANALYSIS - SOCIODEMOGRAPHIC CHARACTERISTICS")
-print("="*80)
-
-# 2.1 Age Distribution
-print("\n" + "-"*80)
-print("2.1 CURRENT AGE DISTRIBUTION")
-print("-"*80)
-
-age_group_dist = data['age_group'].value_counts().sort_index()
-print(f"\n📊 Age Groups (N = {len(data):,}):")
-for age_grp, count in age_group_dist.items():
-    pct = count / len(data) * 100
-    print(f"  {age_grp}: {count:5,} ({pct:5.2f}%)")
-
-print(f"\nMean age: {data['v012'].mean():.1f} years (SD: {data['v012'].std():.1f})")
-print(f"Median age: {data['v012'].median():.0f} years")
-
-# 2.2 Education
-print("\n" + "-"*80)
-print("2.2 EDUCATIONAL ATTAINMENT")
-print("-"*80)
-
-edu_dist = data['education_category'].value_counts()
-print(f"\n📊 Education Level (N = {len(data):,}):")
-for edu in ['No education', 'Primary', 'Secondary', 'Higher']:
-    count = edu_dist.get(edu, 0)
-    pct = count / len(data) * 100
-    print(f"  {edu:20s}: {count:5,} ({pct:5.2f}%)")
-
-# Years of education
-years_edu = data['v133'].dropna()
-print(f"\nYears of education completed:")
-print(f"  Mean:   {years_edu.mean():.1f} years (SD: {years_edu.std():.1f})")
-print(f"  Median: {years_edu.median():.0f} years")
-
-# 2.3 Wealth Index
-print("\n" + "-"*80)
-print("2.3 HOUSEHOLD WEALTH INDEX")
-print("-"*80)
-
-wealth_dist = data['wealth_category'].value_counts()
-print(f"\n📊 Wealth Quintile (N = {len(data):,}):")
-for wealth in ['Poorest', 'Poorer', 'Middle', 'Richer', 'Richest']:
-    count = wealth_dist.get(wealth, 0)
-    pct = count / len(data) * 100
-    print(f"  {wealth:15s}: {count:5,} ({pct:5.2f}%)")
-
-# 2.4 Residence
-print("\n" + "-"*80)
-print("2.4 PLACE OF RESIDENCE")
-print("-"*80)
-
-residence_dist = data['residence'].value_counts()
-print(f"\n📊 Residence (N = {len(data):,}):")
-for res, count in residence_dist.items():
-    pct = count / len(data) * 100
-    print(f"  {res:10s}: {count:5,} ({pct:5.2f}%)")
-
-# 2.5 Marital Status
-print("\n" + "-"*80)
-print("2.5 MARITAL STATUS")
-print("-"*80)
-
-marital_dist = data['marital_status'].value_counts()
-print(f"\n📊 Marital Status (N = {len(data):,}):")
-marital_order = ['Never married', 'Married', 'Living together', 'Widowed', 'Divorced', 'Separated']
-for status in marital_order:
-    count = marital_dist.get(status, 0)
-    pct = count / len(data) * 100
-    print(f"  {status:20s}: {count:5,} ({pct:5.2f}%)")
-
-# 2.6 Fertility
-print("\n" + "-"*80)
-print("2.6 FERTILITY PATTERNS")
-print("-"*80)
-
-total_children = data['v201']
-print(f"\n📊 Total Children Ever Born (N = {len(data):,}):")
-print(f"  Mean:   {total_children.mean():.2f} children (SD: {total_children.std():.2f})")
-print(f"  Median: {total_children.median():.0f} children")
-print(f"  Range:  {total_children.min():.0f} - {total_children.max():.0f} children")
-
-children_dist = total_children.value_counts().sort_index()
-print(f"\n📊 Distribution:")
-for n_children in range(0, 6):
-    count = children_dist.get(n_children, 0)
-    pct = count / len(data) * 100
-    print(f"  {n_children} children: {count:5,} ({pct:5.2f}%)")
-count_6plus = total_children[total_children >= 6].sum()
-pct_6plus = len(total_children[total_children >= 6]) / len(data) * 100
-print(f"  6+ children: {len(total_children[total_children >= 6]):5,} ({pct_6plus:5.2f}%)")
-
-# ============================================================================
-# PART 3: BIVARIATE ANALYSIS - EARLY SEXUAL DEBUT BY CHARACTERISTICS
-# ============================================================================
-
-print("\n" + "="*80)
-print("PART 3: BIVARIATE ANALYSIS - ASSOCIATIONS WITH EARLY SEXUAL DEBUT")
-print("="*80)
-print("(Among sexually active women only, N = {:,})".format(n_sexually_active))
-
-# Function for chi-square test
-def chi_square_test(data, var1, var2):
-    """Perform chi-square test and return results"""
-    contingency_table = pd.crosstab(data[var1], data[var2])
-    chi2, p_value, dof, expected = chi2_contingency(contingency_table)
-    return chi2, p_value
-
-# Create dataset of sexually active women only
-sexually_active = data[has_sex].copy()
-
-# 3.1 Early Sexual Debut by Age Group
-print("\n" + "-"*80)
-print("3.1 EARLY SEXUAL DEBUT BY CURRENT AGE GROUP")
-print("-"*80)
-
-debut_by_age = pd.crosstab(
-    sexually_active['age_group'],
-    sexually_active['early_sexual_debut'],
-    normalize='index'
-) * 100
-
-print("\n📊 Early Sexual Debut Rate by Age Group:")
-print("    Age Group    |  Normal (%)  |  Early (%)   |    N")
-print("    " + "-"*56)
-age_group_order = ['15-19', '20-24', '25-29', '30-34', '35-39', '40-44', '45-49']
-for age_grp in age_group_order:
-    age_data = sexually_active[sexually_active['age_group'] == age_grp]
-    if len(age_data) > 0:
-        n = len(age_data)
-        early_pct = debut_by_age.loc[age_grp, 1.0] if age_grp in debut_by_age.index and 1.0 in debut_by_age.columns else 0
-        normal_pct = debut_by_age.loc[age_grp, 0.0] if age_grp in debut_by_age.index and 0.0 in debut_by_age.columns else 0
-        print(f"    {age_grp:12s} | {normal_pct:11.1f}% | {early_pct:11.1f}% | {n:6,}")
-
-chi2, p_val = chi_square_test(sexually_active, 'age_group', 'early_sexual_debut')
-print(f"\n    χ² = {chi2:.2f}, p-value < 0.001 {'***' if p_val < 0.001 else ''}")
-
-# 3.2 Early Sexual Debut by Education
-print("\n" + "-"*80)
-print("3.2 EARLY SEXUAL DEBUT BY EDUCATION LEVEL")
-print("-"*80)
-
-debut_by_edu = pd.crosstab(
-    sexually_active['education_category'],
-    sexually_active['early_sexual_debut'],
-    normalize='index'
-) * 100
-
-print("\n📊 Early Sexual Debut Rate by Education:")
-print("    Education       |  Normal (%)  |  Early (%)   |    N")
-print("    " + "-"*56)
-edu_order = ['No education', 'Primary', 'Secondary', 'Higher']
-for edu in edu_order:
-    edu_data = sexually_active[sexually_active['education_category'] == edu]
-    if len(edu_data) > 0:
-        n = len(edu_data)
-        early_pct = debut_by_edu.loc[edu, 1.0] if 1.0 in debut_by_edu.columns else 0
-        normal_pct = debut_by_edu.loc[edu, 0.0] if 0.0 in debut_by_edu.columns else 0
-        print(f"    {edu:15s} | {normal_pct:11.1f}% | {early_pct:11.1f}% | {n:6,}")
-
-chi2, p_val = chi_square_test(sexually_active, 'education_category', 'early_sexual_debut')
-print(f"\n    χ² = {chi2:.2f}, p-value < 0.001 {'***' if p_val < 0.001 else ''}")
-print(f"\n    📌 KEY FINDING: Clear education gradient - early debut decreases")
-print(f"       with higher education (from {debut_by_edu.loc['No education', 1.0]:.1f}% to {debut_by_edu.loc['Higher', 1.0]:.1f}%)")
-
-# 3.3 Early Sexual Debut by Wealth
-print("\n" + "-"*80)
-print("3.3 EARLY SEXUAL DEBUT BY WEALTH QUINTILE")
-print("-"*80)
-
-debut_by_wealth = pd.crosstab(
-    sexually_active['wealth_category'],
-    sexually_active['early_sexual_debut'],
-    normalize='index'
-) * 100
-
-print("\n📊 Early Sexual Debut Rate by Wealth:")
-print("    Wealth Quintile |  Normal (%)  |  Early (%)   |    N")
-print("    " + "-"*56)
-wealth_order = ['Poorest', 'Poorer', 'Middle', 'Richer', 'Richest']
-for wealth in wealth_order:
-    wealth_data = sexually_active[sexually_active['wealth_category'] == wealth]
-    if len(wealth_data) > 0:
-        n = len(wealth_data)
-        early_pct = debut_by_wealth.loc[wealth, 1.0] if 1.0 in debut_by_wealth.columns else 0
-        normal_pct = debut_by_wealth.loc[wealth, 0.0] if 0.0 in debut_by_wealth.columns else 0
-        print(f"    {wealth:15s} | {normal_pct:11.1f}% | {early_pct:11.1f}% | {n:6,}")
-
-chi2, p_val = chi_square_test(sexually_active, 'wealth_category', 'early_sexual_debut')
-print(f"\n    χ² = {chi2:.2f}, p-value < 0.001 {'***' if p_val < 0.001 else ''}")
-print(f"\n    📌 KEY FINDING: Wealth gradient - early debut decreases with")
-print(f"       increasing wealth (from {debut_by_wealth.loc['Poorest', 1.0]:.1f}% to {debut_by_wealth.loc['Richest', 1.0]:.1f}%)")
-
-# 3.4 Early Sexual Debut by Residence
-print("\n" + "-"*80)
-print("3.4 EARLY SEXUAL DEBUT BY RESIDENCE")
-print("-"*80)
-
-debut_by_residence = pd.crosstab(
-    sexually_active['residence'],
-    sexually_active['early_sexual_debut'],
-    normalize='index'
-) * 100
-
-print("\n📊 Early Sexual Debut Rate by Residence:")
-print("    Residence  |  Normal (%)  |  Early (%)   |    N")
-print("    " + "-"*50)
-for res in ['Rural', 'Urban']:
-    res_data = sexually_active[sexually_active['residence'] == res]
-    if len(res_data) > 0:
-        n = len(res_data)
-        early_pct = debut_by_residence.loc[res, 1.0] if 1.0 in debut_by_residence.columns else 0
-        normal_pct = debut_by_residence.loc[res, 0.0] if 0.0 in debut_by_residence.columns else 0
-        print(f"    {res:10s} | {normal_pct:11.1f}% | {early_pct:11.1f}% | {n:6,}")
-
-chi2, p_val = chi_square_test(sexually_active, 'residence', 'early_sexual_debut')
-print(f"\n    χ² = {chi2:.2f}, p-value = {p_val:.4f} {'***' if p_val < 0.001 else 'NS'}")
-
-if p_val > 0.05:
-    print(f"\n    📌 KEY FINDING: No significant difference between rural and urban")
-else:
-    print(f"\n    📌 KEY FINDING: Significant difference between rural and urban")
-
-# 3.5 Early Sexual Debut by Marital Status
-print("\n" + "-"*80)
-print("3.5 EARLY SEXUAL DEBUT BY MARITAL STATUS")
-print("-"*80)
-
-debut_by_marital = pd.crosstab(
-    sexually_active['marital_status'],
-    sexually_active['early_sexual_debut'],
-    normalize='index'
-) * 100
-
-print("\n📊 Early Sexual Debut Rate by Marital Status:")
-print("    Marital Status   |  Normal (%)  |  Early (%)   |    N")
-print("    " + "-"*56)
-for status in ['Never married', 'Married', 'Living together', 'Widowed', 'Divorced', 'Separated']:
-    status_data = sexually_active[sexually_active['marital_status'] == status]
-    if len(status_data) > 0:
-        n = len(status_data)
-        early_pct = debut_by_marital.loc[status, 1.0] if 1.0 in debut_by_marital.columns else 0
-        normal_pct = debut_by_marital.loc[status, 0.0] if 0.0 in debut_by_marital.columns else 0
-        print(f"    {status:16s} | {normal_pct:11.1f}% | {early_pct:11.1f}% | {n:6,}")
-
-chi2, p_val = chi_square_test(sexually_active, 'marital_status', 'early_sexual_debut')
-print(f"\n    χ² = {chi2:.2f}, p-value < 0.001 {'***' if p_val < 0.001 else ''}")
-
-# ============================================================================
-# PART 4: CREATE PUBLICATION-READY TABLE 1
-# ============================================================================
-
-print("\n" + "="*80)
-print("PART 4: CREATING PUBLICATION-READY TABLE 1")
-print("="*80)
-
-# Create comprehensive Table 1
-table1_data = []
-
-# Overall sample
-table1_data.append({
-    'Characteristic': 'Total Sample',
-    'Category': '',
-    'N_total': len(data),
-    'Percent_total': 100.0,
-    'N_sexually_active': n_sexually_active,
-    'Early_debut_pct': early_debut_rate,
-    'p_value': ''
-})
-
-# Age groups
-for age_grp in ['15-19', '20-24', '25-29', '30-34', '35-39', '40-44', '45-49']:
-    total_n = len(data[data['age_group'] == age_grp])
-    total_pct = total_n / len(data) * 100
-    
-    active_data = sexually_active[sexually_active['age_group'] == age_grp]
-    n_active = len(active_data)
-    early_pct = active_data['early_sexual_debut'].mean() * 100 if n_active > 0 else 0
-    
-    table1_data.append({
-        'Characteristic': 'Age group' if age_grp == '15-19' else '',
-        'Category': age_grp,
-        'N_total': total_n,
-        'Percent_total': total_pct,
-        'N_sexually_active': n_active,
-        'Early_debut_pct': early_pct,
-        'p_value': '<0.001' if age_grp == '15-19' else ''
-    })
-
-# Education
-for edu in ['No education', 'Primary', 'Secondary', 'Higher']:
-    total_n = len(data[data['education_category'] == edu])
-    total_pct = total_n / len(data) * 100
-    
-    active_data = sexually_active[sexually_active['education_category'] == edu]
-    n_active = len(active_data)
-    early_pct = active_data['early_sexual_debut'].mean() * 100 if n_active > 0 else 0
-    
-    table1_data.append({
-        'Characteristic': 'Education' if edu == 'No education' else '',
-        'Category': edu,
-        'N_total': total_n,
-        'Percent_total': total_pct,
-        'N_sexually_active': n_active,
-        'Early_debut_pct': early_pct,
-        'p_value': '<0.001' if edu == 'No education' else ''
-    })
-
-# Wealth
-for wealth in ['Poorest', 'Poorer', 'Middle', 'Richer', 'Richest']:
-    total_n = len(data[data['wealth_category'] == wealth])
-    total_pct = total_n / len(data) * 100
-    
-    active_data = sexually_active[sexually_active['wealth_category'] == wealth]
-    n_active = len(active_data)
-    early_pct = active_data['early_sexual_debut'].mean() * 100 if n_active > 0 else 0
-    
-    table1_data.append({
-        'Characteristic': 'Wealth quintile' if wealth == 'Poorest' else '',
-        'Category': wealth,
-        'N_total': total_n,
-        'Percent_total': total_pct,
-        'N_sexually_active': n_active,
-        'Early_debut_pct': early_pct,
-        'p_value': '<0.001' if wealth == 'Poorest' else ''
-    })
-
-# Residence
-for res in ['Rural', 'Urban']:
-    total_n = len(data[data['residence'] == res])
-    total_pct = total_n / len(data) * 100
-    
-    active_data = sexually_active[sexually_active['residence'] == res]
-    n_active = len(active_data)
-    early_pct = active_data['early_sexual_debut'].mean() * 100 if n_active > 0 else 0
-    
-    table1_data.append({
-        'Characteristic': 'Residence' if res == 'Rural' else '',
-        'Category': res,
-        'N_total': total_n,
-        'Percent_total': total_pct,
-        'N_sexually_active': n_active,
-        'Early_debut_pct': early_pct,
-        'p_value': '0.825' if res == 'Rural' else ''
-    })
-
-# Create DataFrame and save
-table1_df = pd.DataFrame(table1_data)
-table1_df.to_csv('Table1_Descriptive_Statistics.csv', index=False)
-print("\n✓ Table 1 saved as: Table1_Descriptive_Statistics.csv")
-
-# Print formatted table
-print("\n" + "="*80)
-print("TABLE 1: Sample Characteristics and Early Sexual Debut Prevalence")
-print("="*80)
-print("\nCharacteristic          | Total Sample   | Sexually Active | Early Debut | p-value")
-print("                        |   N      %     |   N             |    %        |")
-print("-"*80)
-
-for _, row in table1_df.iterrows():
-    char = row['Characteristic'] if row['Characteristic'] else '  '
-    cat = row['Category']
-    n_tot = row['N_total']
-    pct_tot = row['Percent_total']
-    n_active = row['N_sexually_active']
-    early_pct = row['Early_debut_pct']
-    p_val = row['p_value']
-    
-    if char:
-        print(f"\n{char}")
-    print(f"  {cat:20s} | {n_tot:5,.0f} ({pct_tot:5.1f}%) | {n_active:6,.0f}         | {early_pct:6.2f}%    | {p_val}")
-
-# ============================================================================
-# PART 5: KEY INSIGHTS AND SUMMARY
-# ============================================================================
-
-print("\n" + "="*80)
-print("PART 5: KEY INSIGHTS FROM EDA")
-print("="*80)
-
-print("""
-🔍 MAJOR FINDINGS:
-
-1. PREVALENCE OF EARLY SEXUAL DEBUT
-   • 25.3% of sexually active women had sexual debut before age 18
-   • 3.9% had very early debut (<15 years) - serious child protection concern
-   • Mean age at first sex: 19.96 years
-
-2. EDUCATION IS THE STRONGEST PROTECTIVE FACTOR
-   • No education: 36.5% early debut
-   • Higher education: 5.3% early debut
-   • Clear linear gradient (p < 0.001)
-   • Each additional level of education reduces risk
-
-3. WEALTH ALSO PROTECTIVE
-   • Poorest quintile: 31.2% early debut
-   • Richest quintile: 20.6% early debut
-   • Significant gradient (p < 0.001)
-   
-4. URBAN-RURAL: NO DIFFERENCE
-   • Rural: 25.3% vs Urban: 25.0%
-   • No statistically significant difference (p = 0.825)
-   • Challenges common urban-rural assumptions
-
-5. AGE GROUP VARIATIONS
-   • Younger cohorts (15-19): 83.6% never had sex (good!)
-   • Older cohorts show historical patterns
-   • Early debut consistent across age groups (18-25%)
-
-6. MARITAL STATUS PATTERNS
-   • Currently married: Lower early debut (suggests marriage may follow sex)
-   • Never married: Higher prevalence of normal debut
-   • Complex relationship requiring deeper analysis
-
-📊 IMPLICATIONS FOR POLICY:
-
-✓ Education is KEY - interventions should prioritize school retention
-✓ Wealth/poverty programs needed - economic factors matter
-✓ Urban AND rural areas need interventions (not just rural)
-✓ Child protection essential - 3.9% very early debut (<15)
-✓ Comprehensive sexuality education needed for all
-
-🔬 NEXT STEPS FOR ANALYSIS:
-
-1. Multivariable logistic regression to identify independent risk factors
-2. Explore interactions (e.g., education × wealth, age × residence)
-3. Examine contraceptive use patterns by debut status
-4. Analyze consequences of early debut (subsequent births, health outcomes)
-""")
-
-print("\n" + "="*80)
-print("✓ EXPLORATORY DATA ANALYSIS COMPLETE")
-print("="*80)
-print("\nOutputs saved:")
-print("  • Table1_Descriptive_Statistics.csv")
-print("\nReady for:")
-print("  • Data visualization (charts and graphs)")
-print("  • Multivariable regression modeling")
-print("  • Manuscript writing")
+import pandas as pd
+import numpy as np
+from data_loader import load_dataset
+from subpopulations import Subpopulations
+from replicate_variance import prevalence_table
+from survey_stats import SurveyDesign, survey_chi2_tests
+from table1 import build_table1
+from streaming_stats import IntegerHistogram
+import warnings
+warnings.filterwarnings('ignore')
+
+"""
+COMPREHENSIVE EXPLORATORY DATA ANALYSIS (EDA)
+==============================================
+Rwanda DHS: Early Sexual Debut and Early Pregnancy Risk Factors
+
+Analysis Structure:
+1. Univariate Analysis (Distribution of all variables)
+2. Bivariate Analysis (Associations with outcomes)
+3. Multivariate Exploration (Interactions and patterns)
+4. Statistical Tests (Chi-square, t-tests, ANOVA)
+5. Visualizations (Publication-ready figures)
+"""
+
+# Load data
+print("="*80)
+print("COMPREHENSIVE EXPLORATORY DATA ANALYSIS")
+print("Early Sexual Debut and Early Pregnancy Risk - Rwanda DHS 2019-20")
+print("="*80)
+
+# Only the columns used in this report are read from the columnar cache
+EDA_COLUMNS = [
+    'v012', 'v133', 'v201', 'v525', 'v531',
+    'early_sexual_debut', 'very_early_debut', 'early_first_birth', 'teen_pregnancy',
+    'sexual_debut_category', 'age_group', 'education_category', 'wealth_category',
+    'residence', 'marital_status',
+    'sample_weight', 'v001'  # survey design
+]
+# Strata are read when the extract has them; otherwise the design is unstratified
+EDA_OPTIONAL_COLUMNS = ['v022']
+DATA_FILE = 'rwanda_dhs_CLEANED_minimal.csv'
+data = load_dataset(DATA_FILE, columns=EDA_COLUMNS, optional=EDA_OPTIONAL_COLUMNS)
+subpops = Subpopulations(data, DATA_FILE)
+print(f"\nDataset: {len(data):,} women aged 15-49 years")
+print(f"Variables: {data.shape[1]} total")
+
+# ============================================================================
+# PART 1: UNIVARIATE ANALYSIS - OUTCOME VARIABLES
+# ============================================================================
+
+print("\n" + "="*80)
+print("PART 1: UNIVARIATE ANALYSIS - PRIMARY OUTCOMES")
+print("="*80)
+
+# 1.1 Sexual Debut Status (All Women)
+print("\n" + "-"*80)
+print("1.1 SEXUAL DEBUT STATUS (N = 14,530)")
+print("-"*80)
+
+debut_distribution = data['sexual_debut_category'].value_counts()
+debut_pct = (debut_distribution / len(data) * 100).round(2)
+
+print("\n📊 Distribution:")
+for category in ['Never had sex', 'Early debut (<18)', 'Normal/Late debut (≥18)']:
+    count = debut_distribution.get(category, 0)
+    pct = debut_pct.get(category, 0)
+    print(f"  {category:30s}: {count:6,} ({pct:6.2f}%)")
+
+print(f"\n✓ Among all women:")
+print(f"  - {debut_pct.get('Early debut (<18)', 0):.1f}% experienced early sexual debut")
+print(f"  - {debut_pct.get('Never had sex', 0):.1f}% have never had sexual intercourse")
+
+# 1.2 Early Sexual Debut (Among Sexually Active Only)
+print("\n" + "-"*80)
+print("1.2 EARLY SEXUAL DEBUT - AMONG SEXUALLY ACTIVE WOMEN")
+print("-"*80)
+
+has_sex = subpops.mask('has_sex')
+n_sexually_active = subpops.count('has_sex')
+has_birth = subpops.mask('has_birth')
+
+# Survey-weighted prevalences with cluster-jackknife 95% CIs (v001 within v022)
+survey_design = SurveyDesign.from_data(data)
+prevalences = prevalence_table(data, {
+    'early_sexual_debut': has_sex, 'very_early_debut': has_sex,
+    'early_first_birth': has_birth, 'teen_pregnancy': has_birth,
+}, survey_design).set_index('outcome')
+
+def weighted_prevalence(outcome):
+    """'xx.xx% (95% CI: lo-hi)' of a weighted prevalence"""
+    row = prevalences.loc[outcome]
+    return f"{row['estimate']:.2f}% (95% CI: {row['ci_low']:.2f}-{row['ci_high']:.2f})"
+
+early_debut_rate = data.loc[has_sex, 'early_sexual_debut'].mean() * 100
+very_early_rate = data.loc[has_sex, 'very_early_debut'].mean() * 100
+
+print(f"\nSample size: {n_sexually_active:,} women")
+print(f"\n📊 Prevalence:")
+print(f"  Early sexual debut (<18 years):      {early_debut_rate:.2f}%")
+print(f"  Very early debut (<15 years):        {very_early_rate:.2f}%")
+print(f"\n📊 Survey-weighted prevalence (jackknife CI):")
+print(f"  Early sexual debut (<18 years):      {weighted_prevalence('early_sexual_debut')}")
+print(f"  Very early debut (<15 years):        {weighted_prevalence('very_early_debut')}")
+
+# Age at first sex distribution
+age_first_sex = data.loc[has_sex, 'v525']
+sex_age_hist = IntegerHistogram.from_values(age_first_sex, data.loc[has_sex, 'sample_weight'])
+stats_sex = sex_age_hist.summary()
+weighted_sex = sex_age_hist.summary(weighted=True)
+print(f"\n📊 Age at First Sexual Intercourse:")
+print(f"  Mean:   {stats_sex['mean']:.2f} years (SD: {stats_sex['sd']:.2f})")
+print(f"  Median: {stats_sex['median']:.0f} years")
+print(f"  Range:  {stats_sex['min']:.0f} - {stats_sex['max']:.0f} years")
+print(f"  IQR:    Q1={stats_sex['q1']:.0f}, Q3={stats_sex['q3']:.0f}")
+print(f"  Weighted: mean {weighted_sex['mean']:.2f} (SD: {weighted_sex['sd']:.2f}), "
+      f"median {weighted_sex['median']:.0f}, IQR {weighted_sex['q1']:.0f}-{weighted_sex['q3']:.0f}")
+
+# Distribution by age categories
+age_categories = pd.cut(age_first_sex, bins=[0, 15, 18, 20, 25, 50], 
+                        labels=['<15', '15-17', '18-19', '20-24', '25+'])
+print(f"\n📊 Age distribution:")
+age_dist = age_categories.value_counts().sort_index()
+for age_cat, count in age_dist.items():
+    pct = count / len(age_first_sex) * 100
+    print(f"  {age_cat:10s}: {count:5,} ({pct:5.2f}%)")
+
+# 1.3 Early First Birth (Among Women Who Gave Birth)
+print("\n" + "-"*80)
+print("1.3 EARLY FIRST BIRTH - AMONG WOMEN WHO GAVE BIRTH")
+print("-"*80)
+
+n_mothers = subpops.count('has_birth')
+
+early_birth_rate = data.loc[has_birth, 'early_first_birth'].mean() * 100
+teen_pregnancy_rate = data.loc[has_birth, 'teen_pregnancy'].mean() * 100
+
+print(f"\nSample size: {n_mothers:,} women")
+print(f"\n📊 Prevalence:")
+print(f"  Early first birth (<18 years):       {early_birth_rate:.2f}%")
+print(f"  Teen pregnancy (<20 years):          {teen_pregnancy_rate:.2f}%")
+print(f"\n📊 Survey-weighted prevalence (jackknife CI):")
+print(f"  Early first birth (<18 years):       {weighted_prevalence('early_first_birth')}")
+print(f"  Teen pregnancy (<20 years):          {weighted_prevalence('teen_pregnancy')}")
+
+# Age at first birth distribution
+birth_age_hist = IntegerHistogram.from_values(data.loc[has_birth, 'v531'],
+                                              data.loc[has_birth, 'sample_weight'])
+stats_birth = birth_age_hist.summary()
+weighted_birth = birth_age_hist.summary(weighted=True)
+print(f"\n📊 Age at First Birth:")
+print(f"  Mean:   {stats_birth['mean']:.2f} years (SD: {stats_birth['sd']:.2f})")
+print(f"  Median: {stats_birth['median']:.0f} years")
+print(f"  Range:  {stats_birth['min']:.0f} - {stats_birth['max']:.0f} years")
+print(f"  Weighted: mean {weighted_birth['mean']:.2f} (SD: {weighted_birth['sd']:.2f}), "
+      f"median {weighted_birth['median']:.0f}, IQR {weighted_birth['q1']:.0f}-{weighted_birth['q3']:.0f}")
+
+# ============================================================================
+# PART 2: UNIVARIATE ANALYSIS - EXPLANATORY VARIABLES
+# ============================================================================
+
+print("\n" + "="*80)
+print("PART 2: UNIVARIATE ANALYSIS - SOCIODEMOGRAPHIC CHARACTERISTICS")
+print("="*80)
+
+# 2.1 Age Distribution
+print("\n" + "-"*80)
+print("2.1 CURRENT AGE DISTRIBUTION")
+print("-"*80)
+
+age_group_dist = data['age_group'].value_counts().sort_index()
+print(f"\n📊 Age Groups (N = {len(data):,}):")
+for age_grp, count in age_group_dist.items():
+    pct = count / len(data) * 100
+    print(f"  {age_grp}: {count:5,} ({pct:5.2f}%)")
+
+print(f"\nMean age: {data['v012'].mean():.1f} years (SD: {data['v012'].std():.1f})")
+print(f"Median age: {data['v012'].median():.0f} years")
+
+# 2.2 Education
+print("\n" + "-"*80)
+print("2.2 EDUCATIONAL ATTAINMENT")
+print("-"*80)
+
+edu_dist = data['education_category'].value_counts()
+print(f"\n📊 Education Level (N = {len(data):,}):")
+for edu in ['No education', 'Primary', 'Secondary', 'Higher']:
+    count = edu_dist.get(edu, 0)
+    pct = count / len(data) * 100
+    print(f"  {edu:20s}: {count:5,} ({pct:5.2f}%)")
+
+# Years of education
+years_edu = data['v133'].dropna()
+print(f"\nYears of education completed:")
+print(f"  Mean:   {years_edu.mean():.1f} years (SD: {years_edu.std():.1f})")
+print(f"  Median: {years_edu.median():.0f} years")
+
+# 2.3 Wealth Index
+print("\n" + "-"*80)
+print("2.3 HOUSEHOLD WEALTH INDEX")
+print("-"*80)
+
+wealth_dist = data['wealth_category'].value_counts()
+print(f"\n📊 Wealth Quintile (N = {len(data):,}):")
+for wealth in ['Poorest', 'Poorer', 'Middle', 'Richer', 'Richest']:
+    count = wealth_dist.get(wealth, 0)
+    pct = count / len(data) * 100
+    print(f"  {wealth:15s}: {count:5,} ({pct:5.2f}%)")
+
+# 2.4 Residence
+print("\n" + "-"*80)
+print("2.4 PLACE OF RESIDENCE")
+print("-"*80)
+
+residence_dist = data['residence'].value_counts()
+print(f"\n📊 Residence (N = {len(data):,}):")
+for res, count in residence_dist.items():
+    pct = count / len(data) * 100
+    print(f"  {res:10s}: {count:5,} ({pct:5.2f}%)")
+
+# 2.5 Marital Status
+print("\n" + "-"*80)
+print("2.5 MARITAL STATUS")
+print("-"*80)
+
+marital_dist = data['marital_status'].value_counts()
+print(f"\n📊 Marital Status (N = {len(data):,}):")
+marital_order = ['Never married', 'Married', 'Living together', 'Widowed', 'Divorced', 'Separated']
+for status in marital_order:
+    count = marital_dist.get(status, 0)
+    pct = count / len(data) * 100
+    print(f"  {status:20s}: {count:5,} ({pct:5.2f}%)")
+
+# 2.6 Fertility
+print("\n" + "-"*80)
+print("2.6 FERTILITY PATTERNS")
+print("-"*80)
+
+total_children = data['v201']
+print(f"\n📊 Total Children Ever Born (N = {len(data):,}):")
+print(f"  Mean:   {total_children.mean():.2f} children (SD: {total_children.std():.2f})")
+print(f"  Median: {total_children.median():.0f} children")
+print(f"  Range:  {total_children.min():.0f} - {total_children.max():.0f} children")
+
+children_dist = total_children.value_counts().sort_index()
+print(f"\n📊 Distribution:")
+for n_children in range(0, 6):
+    count = children_dist.get(n_children, 0)
+    pct = count / len(data) * 100
+    print(f"  {n_children} children: {count:5,} ({pct:5.2f}%)")
+count_6plus = total_children[total_children >= 6].sum()
+pct_6plus = len(total_children[total_children >= 6]) / len(data) * 100
+print(f"  6+ children: {len(total_children[total_children >= 6]):5,} ({pct_6plus:5.2f}%)")
+
+# ============================================================================
+# PART 3: BIVARIATE ANALYSIS - EARLY SEXUAL DEBUT BY CHARACTERISTICS
+# ============================================================================
+
+print("\n" + "="*80)
+print("PART 3: BIVARIATE ANALYSIS - ASSOCIATIONS WITH EARLY SEXUAL DEBUT")
+print("="*80)
+print("(Among sexually active women only, N = {:,})".format(n_sexually_active))
+
+# Survey-weighted Rao-Scott chi-square tests of every bivariate table, in one
+# pass (domain = sexually active women; the full design is kept for variances)
+BIVARIATE_VARS = ['age_group', 'education_category', 'wealth_category', 'residence', 'marital_status']
+survey_tests, weighted_tables = survey_chi2_tests(data, BIVARIATE_VARS, 'early_sexual_debut',
+                                                  survey_design, rows=has_sex)
+survey_tests = survey_tests.set_index('variable')
+
+# Function for chi-square test
+def chi_square_test(var):
+    """Design-corrected (Rao-Scott) chi-square against early sexual debut, and its p-value"""
+    return survey_tests.loc[var, 'chi2_rao_scott'], survey_tests.loc[var, 'p_value']
+
+# Create dataset of sexually active women only
+sexually_active = subpops.take('has_sex')
+
+# 3.1 Early Sexual Debut by Age Group
+print("\n" + "-"*80)
+print("3.1 EARLY SEXUAL DEBUT BY CURRENT AGE GROUP")
+print("-"*80)
+
+debut_by_age = pd.crosstab(
+    sexually_active['age_group'],
+    sexually_active['early_sexual_debut'],
+    normalize='index'
+) * 100
+
+print("\n📊 Early Sexual Debut Rate by Age Group:")
+print("    Age Group    |  Normal (%)  |  Early (%)   |    N")
+print("    " + "-"*56)
+age_group_order = ['15-19', '20-24', '25-29', '30-34', '35-39', '40-44', '45-49']
+for age_grp in age_group_order:
+    age_data = sexually_active[sexually_active['age_group'] == age_grp]
+    if len(age_data) > 0:
+        n = len(age_data)
+        early_pct = debut_by_age.loc[age_grp, 1.0] if age_grp in debut_by_age.index and 1.0 in debut_by_age.columns else 0
+        normal_pct = debut_by_age.loc[age_grp, 0.0] if age_grp in debut_by_age.index and 0.0 in debut_by_age.columns else 0
+        print(f"    {age_grp:12s} | {normal_pct:11.1f}% | {early_pct:11.1f}% | {n:6,}")
+
+chi2, p_val = chi_square_test('age_group')
+print(f"\n    Rao-Scott χ² = {chi2:.2f}, p-value {'< 0.001' if p_val < 0.001 else f'= {p_val:.3f}'} {'***' if p_val < 0.001 else ''}")
+
+# 3.2 Early Sexual Debut by Education
+print("\n" + "-"*80)
+print("3.2 EARLY SEXUAL DEBUT BY EDUCATION LEVEL")
+print("-"*80)
+
+debut_by_edu = pd.crosstab(
+    sexually_active['education_category'],
+    sexually_active['early_sexual_debut'],
+    normalize='index'
+) * 100
+
+print("\n📊 Early Sexual Debut Rate by Education:")
+print("    Education       |  Normal (%)  |  Early (%)   |    N")
+print("    " + "-"*56)
+edu_order = ['No education', 'Primary', 'Secondary', 'Higher']
+for edu in edu_order:
+    edu_data = sexually_active[sexually_active['education_category'] == edu]
+    if len(edu_data) > 0:
+        n = len(edu_data)
+        early_pct = debut_by_edu.loc[edu, 1.0] if 1.0 in debut_by_edu.columns else 0
+        normal_pct = debut_by_edu.loc[edu, 0.0] if 0.0 in debut_by_edu.columns else 0
+        print(f"    {edu:15s} | {normal_pct:11.1f}% | {early_pct:11.1f}% | {n:6,}")
+
+chi2, p_val = chi_square_test('education_category')
+print(f"\n    Rao-Scott χ² = {chi2:.2f}, p-value {'< 0.001' if p_val < 0.001 else f'= {p_val:.3f}'} {'***' if p_val < 0.001 else ''}")
+print(f"\n    📌 KEY FINDING: Clear education gradient - early debut decreases")
+print(f"       with higher education (from {debut_by_edu.loc['No education', 1.0]:.1f}% to {debut_by_edu.loc['Higher', 1.0]:.1f}%)")
+
+# 3.3 Early Sexual Debut by Wealth
+print("\n" + "-"*80)
+print("3.3 EARLY SEXUAL DEBUT BY WEALTH QUINTILE")
+print("-"*80)
+
+debut_by_wealth = pd.crosstab(
+    sexually_active['wealth_category'],
+    sexually_active['early_sexual_debut'],
+    normalize='index'
+) * 100
+
+print("\n📊 Early Sexual Debut Rate by Wealth:")
+print("    Wealth Quintile |  Normal (%)  |  Early (%)   |    N")
+print("    " + "-"*56)
+wealth_order = ['Poorest', 'Poorer', 'Middle', 'Richer', 'Richest']
+for wealth in wealth_order:
+    wealth_data = sexually_active[sexually_active['wealth_category'] == wealth]
+    if len(wealth_data) > 0:
+        n = len(wealth_data)
+        early_pct = debut_by_wealth.loc[wealth, 1.0] if 1.0 in debut_by_wealth.columns else 0
+        normal_pct = debut_by_wealth.loc[wealth, 0.0] if 0.0 in debut_by_wealth.columns else 0
+        print(f"    {wealth:15s} | {normal_pct:11.1f}% | {early_pct:11.1f}% | {n:6,}")
+
+chi2, p_val = chi_square_test('wealth_category')
+print(f"\n    Rao-Scott χ² = {chi2:.2f}, p-value {'< 0.001' if p_val < 0.001 else f'= {p_val:.3f}'} {'***' if p_val < 0.001 else ''}")
+print(f"\n    📌 KEY FINDING: Wealth gradient - early debut decreases with")
+print(f"       increasing wealth (from {debut_by_wealth.loc['Poorest', 1.0]:.1f}% to {debut_by_wealth.loc['Richest', 1.0]:.1f}%)")
+
+# 3.4 Early Sexual Debut by Residence
+print("\n" + "-"*80)
+print("3.4 EARLY SEXUAL DEBUT BY RESIDENCE")
+print("-"*80)
+
+debut_by_residence = pd.crosstab(
+    sexually_active['residence'],
+    sexually_active['early_sexual_debut'],
+    normalize='index'
+) * 100
+
+print("\n📊 Early Sexual Debut Rate by Residence:")
+print("    Residence  |  Normal (%)  |  Early (%)   |    N")
+print("    " + "-"*50)
+for res in ['Rural', 'Urban']:
+    res_data = sexually_active[sexually_active['residence'] == res]
+    if len(res_data) > 0:
+        n = len(res_data)
+        early_pct = debut_by_residence.loc[res, 1.0] if 1.0 in debut_by_residence.columns else 0
+        normal_pct = debut_by_residence.loc[res, 0.0] if 0.0 in debut_by_residence.columns else 0
+        print(f"    {res:10s} | {normal_pct:11.1f}% | {early_pct:11.1f}% | {n:6,}")
+
+chi2, p_val = chi_square_test('residence')
+print(f"\n    Rao-Scott χ² = {chi2:.2f}, p-value = {p_val:.4f} {'***' if p_val < 0.001 else 'NS'}")
+
+if p_val > 0.05:
+    print(f"\n    📌 KEY FINDING: No significant difference between rural and urban")
+else:
+    print(f"\n    📌 KEY FINDING: Significant difference between rural and urban")
+
+# 3.5 Early Sexual Debut by Marital Status
+print("\n" + "-"*80)
+print("3.5 EARLY SEXUAL DEBUT BY MARITAL STATUS")
+print("-"*80)
+
+debut_by_marital = pd.crosstab(
+    sexually_active['marital_status'],
+    sexually_active['early_sexual_debut'],
+    normalize='index'
+) * 100
+
+print("\n📊 Early Sexual Debut Rate by Marital Status:")
+print("    Marital Status   |  Normal (%)  |  Early (%)   |    N")
+print("    " + "-"*56)
+for status in ['Never married', 'Married', 'Living together', 'Widowed', 'Divorced', 'Separated']:
+    status_data = sexually_active[sexually_active['marital_status'] == status]
+    if len(status_data) > 0:
+        n = len(status_data)
+        early_pct = debut_by_marital.loc[status, 1.0] if 1.0 in debut_by_marital.columns else 0
+        normal_pct = debut_by_marital.loc[status, 0.0] if 0.0 in debut_by_marital.columns else 0
+        print(f"    {status:16s} | {normal_pct:11.1f}% | {early_pct:11.1f}% | {n:6,}")
+
+chi2, p_val = chi_square_test('marital_status')
+print(f"\n    Rao-Scott χ² = {chi2:.2f}, p-value {'< 0.001' if p_val < 0.001 else f'= {p_val:.3f}'} {'***' if p_val < 0.001 else ''}")
+
+# ============================================================================
+# PART 4: CREATE PUBLICATION-READY TABLE 1
+# ============================================================================
+
+print("\n" + "="*80)
+print("PART 4: CREATING PUBLICATION-READY TABLE 1")
+print("="*80)
+
+# Create comprehensive Table 1 (one grouped pass per characteristic; Rao-Scott p-values)
+table1_df = build_table1(data, has_sex, p_values=survey_tests['p_value'])
+
+# Save
+table1_df.to_csv('Table1_Descriptive_Statistics.csv', index=False)
+print("\n✓ Table 1 saved as: Table1_Descriptive_Statistics.csv")
+
+# Print formatted table
+print("\n" + "="*80)
+print("TABLE 1: Sample Characteristics and Early Sexual Debut Prevalence")
+print("="*80)
+print("\nCharacteristic          | Total Sample   | Sexually Active | Early Debut | p-value")
+print("                        |   N      %     |   N             |    %        |")
+print("-"*80)
+
+for _, row in table1_df.iterrows():
+    char = row['Characteristic'] if row['Characteristic'] else '  '
+    cat = row['Category']
+    n_tot = row['N_total']
+    pct_tot = row['Percent_total']
+    n_active = row['N_sexually_active']
+    early_pct = row['Early_debut_pct']
+    p_val = row['p_value']
+    
+    if char:
+        print(f"\n{char}")
+    print(f"  {cat:20s} | {n_tot:5,.0f} ({pct_tot:5.1f}%) | {n_active:6,.0f}         | {early_pct:6.2f}%    | {p_val}")
+
+# ============================================================================
+# PART 5: KEY INSIGHTS AND SUMMARY
+# ============================================================================
+
+print("\n" + "="*80)
+print("PART 5: KEY INSIGHTS FROM EDA")
+print("="*80)
+
+print("""
+🔍 MAJOR FINDINGS:
+
+1. PREVALENCE OF EARLY SEXUAL DEBUT
+   • 25.3% of sexually active women had sexual debut before age 18
+   • 3.9% had very early debut (<15 years) - serious child protection concern
+   • Mean age at first sex: 19.96 years
+
+2. EDUCATION IS THE STRONGEST PROTECTIVE FACTOR
+   • No education: 36.5% early debut
+   • Higher education: 5.3% early debut
+   • Clear linear gradient (p < 0.001)
+   • Each additional level of education reduces risk
+
+3. WEALTH ALSO PROTECTIVE
+   • Poorest quintile: 31.2% early debut
+   • Richest quintile: 20.6% early debut
+   • Significant gradient (p < 0.001)
+   
+4. URBAN-RURAL: NO DIFFERENCE
+   • Rural: 25.3% vs Urban: 25.0%
+   • No statistically significant difference (p = 0.825)
+   • Challenges common urban-rural assumptions
+
+5. AGE GROUP VARIATIONS
+   • Younger cohorts (15-19): 83.6% never had sex (good!)
+   • Older cohorts show historical patterns
+   • Early debut consistent across age groups (18-25%)
+
+6. MARITAL STATUS PATTERNS
+   • Currently married: Lower early debut (suggests marriage may follow sex)
+   • Never married: Higher prevalence of normal debut
+   • Complex relationship requiring deeper analysis
+
+📊 IMPLICATIONS FOR POLICY:
+
+✓ Education is KEY - interventions should prioritize school retention
+✓ Wealth/poverty programs needed - economic factors matter
+✓ Urban AND rural areas need interventions (not just rural)
+✓ Child protection essential - 3.9% very early debut (<15)
+✓ Comprehensive sexuality education needed for all
+
+🔬 NEXT STEPS FOR ANALYSIS:
+
+1. Multivariable logistic regression to identify independent risk factors
+2. Explore interactions (e.g., education × wealth, age × residence)
+3. Examine contraceptive use patterns by debut status
+4. Analyze consequences of early debut (subsequent births, health outcomes)
+""")
+
+print("\n" + "="*80)
+print("✓ EXPLORATORY DATA ANALYSIS COMPLETE")
+print("="*80)
+print("\nOutputs saved:")
+print("  • Table1_Descriptive_Statistics.csv")
+print("\nReady for:")
+print("  • Data visualization (charts and graphs)")
+print("  • Multivariable regression modeling")
+print("  • Manuscript writing")
 print("="*80)
\ No newline at end of file
@@ -0,0 +1,291 @@
+"""
+MATERIALIZED AGGREGATE CUBE FOR SUBGROUP QUERIES
+================================================
+
+Holds, for every cell of
+
+    age_group x education_category x wealth_category x residence
+              x marital_status x province (v024)
+
+the unweighted and weighted number of women and, for each outcome, the
+number of women in its domain (non-missing outcome) and the unweighted and
+weighted outcome sums. Any roll-up or slice (e.g. early debut by education
+within Kigali) is answered by summing cube cells, without touching the
+respondent-level data.
+
+The cube is persisted next to the dataset cache (`.dhs_cache/<csv>.cube.npz`)
+together with a per-respondent ledger (`<csv>.cube_ledger.parquet`: caseid,
+row hash, cell and contributions). When the cleaned dataset changes, only the
+contributions of removed, changed and new respondents are subtracted / added.
+
+Usage:
+    cube, n_updated = load_cube(data, 'rwanda_dhs_CLEANED_minimal.csv')
+    cube.query('early_sexual_debut', by=['education_category'], where={'v024': 'Kigali City'})
+
+    python aggregate_cube.py --by education_category residence --where v024=East
+"""
+
+import os
+import json
+import hashlib
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from data_loader import cache_path_for, load_dataset, pq
+from dhs_schema import build_schema
+
+DATA_FILE = 'rwanda_dhs_CLEANED_minimal.csv'
+CUBE_SUFFIX = '.cube.npz'
+LEDGER_SUFFIX = '.cube_ledger.parquet'
+
+DIMENSIONS = ['age_group', 'education_category', 'wealth_category', 'residence',
+              'marital_status', 'v024']
+OUTCOMES = ['early_sexual_debut', 'very_early_debut', 'early_first_birth', 'teen_pregnancy']
+WEIGHT_COLUMN = 'sample_weight'
+MISSING_LEVEL = '(missing)'
+
+
+# ===== CELL CODING =====
+
+def dimension_levels(schema=None, dimensions=DIMENSIONS):
+    """Levels of each dimension from the schema, plus a trailing missing level"""
+    schema = build_schema() if schema is None else schema
+    levels = {}
+    for name in dimensions:
+        spec = schema[name]
+        labels = spec.get('categories') or list(spec['value_labels'].values())
+        levels[name] = list(labels) + [MISSING_LEVEL]
+    return levels
+
+
+def cell_index(data, levels, schema=None):
+    """Flat cube cell of every row (C order over the dimensions)"""
+    schema = build_schema() if schema is None else schema
+    cells = np.zeros(len(data), dtype=np.int64)
+    for name, dim_levels in levels.items():
+        values = data[name]
+        value_labels = schema[name].get('value_labels')
+        if schema[name]['kind'] != 'category' and value_labels:
+            values = values.map(value_labels)
+        codes = pd.Categorical(values, categories=dim_levels[:-1]).codes
+        codes = np.where(codes < 0, len(dim_levels) - 1, codes)
+        cells = cells * len(dim_levels) + codes
+    return cells
+
+
+def row_hashes(data, columns):
+    """64-bit hash of the cube inputs of every row"""
+    return pd.util.hash_pandas_object(data[columns], index=False).to_numpy()
+
+
+def definition_signature(levels, outcomes):
+    """Identify the cube layout a ledger and cube were built with"""
+    payload = json.dumps({'levels': levels, 'outcomes': outcomes, 'weight': WEIGHT_COLUMN},
+                         sort_keys=True)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+# ===== CUBE =====
+
+class AggregateCube:
+    """Dense per-cell counts and sums, queried by summing over cells"""
+
+    def __init__(self, levels, outcomes, measures=None):
+        self.levels = levels
+        self.dimensions = list(levels)
+        self.outcomes = list(outcomes)
+        self.shape = tuple(len(dim_levels) for dim_levels in levels.values())
+        n_cells = int(np.prod(self.shape))
+        names = ['n', 'weight'] + [f'{outcome}:{stat}' for outcome in self.outcomes
+                                   for stat in ('n', 'weight', 'sum', 'wsum')]
+        self.measures = measures or {name: np.zeros(n_cells) for name in names}
+
+    def add(self, cells, weights, outcome_values, sign=1.0):
+        """Add (sign=1) or remove (sign=-1) the contributions of a set of rows"""
+        n_cells = len(self.measures['n'])
+
+        def accumulate(name, index, values=None):
+            totals = np.bincount(index, weights=values, minlength=n_cells)
+            self.measures[name] += sign * totals
+
+        accumulate('n', cells)
+        accumulate('weight', cells, weights)
+        for outcome in self.outcomes:
+            values = outcome_values[outcome]
+            valid = ~np.isnan(values)
+            accumulate(f'{outcome}:n', cells[valid])
+            accumulate(f'{outcome}:weight', cells[valid], weights[valid])
+            accumulate(f'{outcome}:sum', cells[valid], values[valid])
+            accumulate(f'{outcome}:wsum', cells[valid], weights[valid] * values[valid])
+
+    def _selected(self, where):
+        """{dimension: selected levels} of a `where`, deduplicated and in cube level order"""
+        selection = {}
+        for dim, selected in (where or {}).items():
+            selected = [selected] if isinstance(selected, (str, int)) else selected
+            positions = sorted({self.levels[dim].index(level) for level in selected})
+            selection[dim] = [self.levels[dim][i] for i in positions]
+        return selection
+
+    def _reduce(self, name, by, where):
+        """Sum a measure over every dimension not in `by`, after slicing by `where`"""
+        values = self.measures[name].reshape(self.shape)
+        for dim, selected in self._selected(where).items():
+            axis = self.dimensions.index(dim)
+            positions = [self.levels[dim].index(level) for level in selected]
+            values = np.take(values, positions, axis=axis)
+        other_axes = tuple(i for i, dim in enumerate(self.dimensions) if dim not in by)
+        values = values.sum(axis=other_axes)
+        # Put the remaining axes in the order requested in `by`
+        remaining = [dim for dim in self.dimensions if dim in by]
+        return np.transpose(values, [remaining.index(dim) for dim in by])
+
+    def query(self, outcome=None, by=(), where=None, weighted=True, drop_empty=True):
+        """
+        Counts (and the outcome rate in %) for every combination of `by` levels.
+
+        `where` restricts cells: {dimension: level or list of levels}; a
+        dimension in both `where` and `by` is reported for the selected levels.
+        """
+        by = list(by)
+        where = self._selected(where)
+        # A dimension sliced by `where` only has its selected levels left
+        index = pd.MultiIndex.from_product([where.get(dim, self.levels[dim]) for dim in by], names=by) \
+            if by else pd.Index(['All'], name='subgroup')
+
+        columns = {'n': self._reduce('n', by, where).ravel(),
+                   'weighted_n': self._reduce('weight', by, where).ravel()}
+        if outcome is not None:
+            prefix = outcome + ':'
+            columns['n_domain'] = self._reduce(prefix + 'n', by, where).ravel()
+            numerator = self._reduce(prefix + ('wsum' if weighted else 'sum'), by, where).ravel()
+            denominator = self._reduce(prefix + ('weight' if weighted else 'n'), by, where).ravel()
+            with np.errstate(invalid='ignore', divide='ignore'):
+                columns['rate'] = numerator / denominator * 100
+
+        result = pd.DataFrame(columns, index=index)
+        result['n'] = result['n'].round().astype(np.int64)
+        if 'n_domain' in result:
+            result['n_domain'] = result['n_domain'].round().astype(np.int64)
+        return result[result['n'] > 0] if drop_empty else result
+
+    def save(self, path, signature):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_file = path + f'.tmp{os.getpid()}.npz'
+        meta = json.dumps({'levels': self.levels, 'outcomes': self.outcomes, 'signature': signature})
+        np.savez(tmp_file, __meta__=np.array(meta), **self.measures)
+        os.replace(tmp_file, path)
+
+    @classmethod
+    def load(cls, path):
+        """(cube, signature) from disk"""
+        with np.load(path) as stored:
+            meta = json.loads(str(stored['__meta__']))
+            measures = {name: stored[name] for name in stored.files if name != '__meta__'}
+        return cls(meta['levels'], meta['outcomes'], measures), meta['signature']
+
+
+# ===== PERSISTENCE WITH INCREMENTAL REBUILD =====
+
+def _contributions(data, levels, outcomes, schema):
+    """Ledger frame (caseid, row_hash, cell, weight, outcomes) of a set of rows"""
+    ledger = pd.DataFrame({
+        'caseid': data['caseid'].to_numpy(),
+        'row_hash': row_hashes(data, list(levels) + outcomes + [WEIGHT_COLUMN]),
+        'cell': cell_index(data, levels, schema),
+        'weight': data[WEIGHT_COLUMN].to_numpy(dtype=float, na_value=0.0),
+    })
+    for outcome in outcomes:
+        ledger[outcome] = data[outcome].to_numpy(dtype=float, na_value=np.nan)
+    return ledger
+
+
+def _apply(cube, ledger, sign):
+    if len(ledger):
+        cube.add(ledger['cell'].to_numpy(), ledger['weight'].to_numpy(),
+                 {outcome: ledger[outcome].to_numpy() for outcome in cube.outcomes}, sign)
+
+
+def load_cube(data, csv_path=DATA_FILE, outcomes=OUTCOMES, full=False):
+    """
+    Cube of `data`, updated incrementally from the one persisted for `csv_path`.
+
+    Returns (cube, number of respondents whose contributions were updated).
+    """
+    schema = build_schema()
+    levels = dimension_levels(schema)
+    signature = definition_signature(levels, outcomes)
+    cube_file = cache_path_for(csv_path, CUBE_SUFFIX)
+    ledger_file = cache_path_for(csv_path, LEDGER_SUFFIX)
+
+    cube, ledger = None, None
+    if not full and pq is not None and os.path.exists(cube_file) and os.path.exists(ledger_file):
+        try:
+            cube, stored_signature = AggregateCube.load(cube_file)
+            ledger = pd.read_parquet(ledger_file)
+            if stored_signature != signature or not ledger['caseid'].is_unique:
+                cube, ledger = None, None
+        except Exception:
+            cube, ledger = None, None
+
+    hashes = row_hashes(data, list(levels) + outcomes + [WEIGHT_COLUMN])
+    if cube is None or not data['caseid'].is_unique:
+        cube = AggregateCube(levels, outcomes)
+        new_ledger = _contributions(data, levels, outcomes, schema)
+        _apply(cube, new_ledger, +1.0)
+        n_updated = len(data)
+    else:
+        previous = pd.Index(ledger['caseid']).get_indexer(data['caseid'].to_numpy())
+        known = previous >= 0
+        unchanged = np.zeros(len(data), dtype=bool)
+        unchanged[known] = ledger['row_hash'].to_numpy()[previous[known]] == hashes[known]
+
+        # Stale contributions: respondents removed from the dataset or whose values changed
+        kept_positions = previous[unchanged]
+        stale = np.ones(len(ledger), dtype=bool)
+        stale[kept_positions] = False
+        _apply(cube, ledger[stale], -1.0)
+
+        changed_rows = np.flatnonzero(~unchanged)
+        fresh = _contributions(data.iloc[changed_rows], levels, outcomes, schema)
+        _apply(cube, fresh, +1.0)
+
+        # Ledger in the current row order
+        unchanged_rows = np.flatnonzero(unchanged)
+        new_ledger = pd.concat([ledger.iloc[kept_positions], fresh], ignore_index=True)
+        order = np.argsort(np.concatenate([unchanged_rows, changed_rows]), kind='stable')
+        new_ledger = new_ledger.iloc[order].reset_index(drop=True)
+        n_removed = len(ledger) - int(known.sum())
+        n_updated = len(changed_rows) + n_removed
+
+    if pq is not None:
+        cube.save(cube_file, signature)
+        tmp_file = ledger_file + f'.tmp{os.getpid()}'
+        new_ledger.to_parquet(tmp_file, index=False)
+        os.replace(tmp_file, ledger_file)
+    return cube, n_updated
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Query the subgroup aggregate cube')
+    parser.add_argument('--by', nargs='*', default=[], choices=DIMENSIONS, help='Dimensions to break down by')
+    parser.add_argument('--where', nargs='*', default=[], metavar='DIM=LEVEL',
+                        help='Restrict to a level of a dimension (repeatable)')
+    parser.add_argument('--outcome', default='early_sexual_debut', choices=OUTCOMES)
+    parser.add_argument('--unweighted', action='store_true', help='Unweighted rates')
+    parser.add_argument('--full', action='store_true', help='Rebuild the cube from scratch')
+    args = parser.parse_args()
+
+    where = {}
+    for item in args.where:
+        dim, level = item.split('=', 1)
+        where.setdefault(dim, []).append(level)
+
+    columns = ['caseid', WEIGHT_COLUMN] + DIMENSIONS + OUTCOMES
+    data = load_dataset(DATA_FILE, columns=columns)
+    cube, n_updated = load_cube(data, DATA_FILE, full=args.full)
+    print(f"Cube: {len(data):,} respondents, {n_updated:,} updated since last build\n")
+    print(cube.query(args.outcome, by=args.by, where=where, weighted=not args.unweighted)
+          .to_string(float_format=lambda x: f'{x:,.2f}'))
@@ -0,0 +1,406 @@
+"""
+DECLARATIVE DATA CONSISTENCY RULES
+==================================
+
+The checks of `check_data_consistency.py` written as declarative rules.
+Each rule has a name, a severity, a label, an expression and the columns to
+export for manual review.
+
+Expressions are written against a `MaskContext`, which hands out column
+arrays and shared sub-expressions (`has_sex`, `has_birth`, `no_sex`, ...).
+Each column and each shared mask is computed at most once, so all rules are
+evaluated in a single pass over the data instead of rebuilding the same
+boolean masks and `.copy()`-ing sub-frames for every check.
+
+Usage:
+    from consistency_rules import evaluate_rules
+    results = evaluate_rules(data)
+    results.count('birth_before_sex')
+    results.frame(data, 'birth_before_sex')
+    results.select(all_of=['birth_before_sex'], none_of=['very_young_mother'])
+
+Every row's results are also packed into a violation bitmap (one bit per
+rule), so combinations of rules are answered with bitwise operations.
+
+For stacked multi-country files, `evaluate_rules_parallel` shards the rows
+by cluster (v001) across a process pool and merges the results.
+"""
+
+import os
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from subpopulations import SUBPOPULATIONS_BY_NAME, valid_age
+
+Rule = namedtuple('Rule', ['name', 'severity', 'label', 'expression', 'columns'])
+
+# Input columns the rules look at (used to hash rows for incremental runs)
+RULE_COLUMNS = [
+    'v005', 'v012', 'v201', 'v213', 'v501', 'v511', 'v525', 'v531', 'v701',
+    'early_sexual_debut', 'sexual_debut_category'
+]
+
+EARLY_DEBUT = 'Early debut (<18)'
+NORMAL_DEBUT = 'Normal/Late debut (≥18)'
+NEVER_HAD_SEX = 'Never had sex'
+
+
+# ===== SHARED SUB-EXPRESSIONS =====
+# Computed lazily, once per evaluation, and reused by every rule below;
+# the analytic subpopulations share their definitions with subpopulations.py
+MASKS = {
+    'has_sex': SUBPOPULATIONS_BY_NAME['has_sex'].expression,
+    'has_birth': SUBPOPULATIONS_BY_NAME['has_birth'].expression,
+    'has_both': SUBPOPULATIONS_BY_NAME['has_both'].expression,
+    'has_union': lambda m: valid_age(m.v511),
+    'no_sex': lambda m: (m.v525 == 0) | np.isnan(m.v525) | (m.v525 >= 50),
+    'no_birth_age': lambda m: np.isnan(m.v531) | (m.v531 == 0) | (m.v531 >= 50),
+    'has_children': lambda m: m.v201 > 0,
+}
+
+
+class MaskContext:
+    """Column arrays and named masks of one dataset, each computed at most once"""
+
+    def __init__(self, data, params=None):
+        self.data = data
+        self.params = params or {}
+        self._cache = {}
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        if name not in self._cache:
+            if name in MASKS:
+                self._cache[name] = MASKS[name](self)
+            else:
+                self._cache[name] = self.column(name)
+        return self._cache[name]
+
+    def column(self, name):
+        """Numeric column as a float array (NaN for missing values)"""
+        return self.data[name].to_numpy(dtype=float, na_value=np.nan)
+
+    def is_value(self, name, value):
+        """Mask of rows where a label column equals `value` (False for missing)"""
+        key = (name, value)
+        if key not in self._cache:
+            values = self.data[name]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                categories = values.cat.categories
+                code = categories.get_loc(value) if value in categories else -2
+                self._cache[key] = values.cat.codes.to_numpy() == code
+            else:
+                self._cache[key] = (values == value).to_numpy(dtype=bool, na_value=False)
+        return self._cache[key]
+
+
+# ===== RULES =====
+# Check numbers follow the sections printed by check_data_consistency.py
+RULES = [
+    # 1. Logical inconsistencies
+    Rule('birth_before_sex', 'critical', 'Birth before first sex',
+         lambda m: m.has_both & (m.v531 < m.v525),
+         ['caseid', 'v525', 'v531', 'v012']),
+    Rule('sex_after_current_age', 'warning', 'Age at first sex > current age',
+         lambda m: m.has_sex & (m.v525 > m.v012),
+         ['caseid', 'v525', 'v012']),
+    Rule('birth_after_current_age', 'warning', 'Age at first birth > current age',
+         lambda m: m.has_birth & (m.v531 > m.v012),
+         ['caseid', 'v531', 'v012']),
+    Rule('children_no_sex', 'critical', 'Children but no sex recorded',
+         lambda m: m.has_children & m.no_sex,
+         ['caseid', 'v525', 'v531', 'v201', 'v012']),
+    Rule('pregnant_no_sex', 'critical', 'Pregnant but never had sex',
+         lambda m: m.no_sex & (m.v213 == 1),
+         ['caseid', 'v525', 'v213']),
+    Rule('union_before_sex', 'info', 'Age at first union < age at first sex',
+         lambda m: m.has_sex & m.has_union & (m.v511 < m.v525),
+         ['caseid', 'v511', 'v525']),
+
+    # 2. Out-of-range values
+    Rule('sex_age_under_10', 'warning', 'Age at first sex < 10',
+         lambda m: (m.v525 > 0) & (m.v525 < 10),
+         ['caseid', 'v525']),
+    Rule('sex_age_over_40', 'info', 'Age at first sex > 40',
+         lambda m: (m.v525 > 40) & (m.v525 < 50),
+         ['caseid', 'v525']),
+    Rule('birth_age_under_12', 'critical', 'First birth before age 12',
+         lambda m: (m.v531 > 0) & (m.v531 < 12),
+         ['caseid', 'v531']),
+    Rule('birth_age_over_45', 'info', 'Age at first birth > 45',
+         lambda m: (m.v531 > 45) & (m.v531 < 50),
+         ['caseid', 'v531']),
+    Rule('age_out_of_range', 'warning', 'Current age outside 15-49',
+         lambda m: (m.v012 < 15) | (m.v012 > 49),
+         ['caseid', 'v012']),
+
+    # 3. Derived variable consistency
+    Rule('early_flag_mismatch', 'critical', 'Early debut flag mismatch',
+         lambda m: (m.has_sex & ~np.isnan(m.early_sexual_debut)
+                    & (m.early_sexual_debut != (m.v525 < 18))),
+         ['caseid', 'v525', 'early_sexual_debut']),
+    Rule('debut_category_mismatch', 'warning', 'Sexual debut category mismatch',
+         lambda m: m.has_sex & ~np.where(m.v525 < 18,
+                                         m.is_value('sexual_debut_category', EARLY_DEBUT),
+                                         m.is_value('sexual_debut_category', NORMAL_DEBUT)),
+         ['caseid', 'v525', 'sexual_debut_category']),
+    Rule('never_sex_with_age', 'warning', "'Never had sex' but has age at first sex",
+         lambda m: m.is_value('sexual_debut_category', NEVER_HAD_SEX) & m.has_sex,
+         ['caseid', 'v525', 'sexual_debut_category']),
+
+    # 4. Missing data patterns
+    Rule('children_no_birth_age', 'warning', 'Children but missing age at first birth',
+         lambda m: m.has_children & m.no_birth_age,
+         ['caseid', 'v201', 'v531']),
+    Rule('children_missing_both', 'warning', 'Children but missing sex and birth ages',
+         lambda m: m.has_children & m.no_sex & m.no_birth_age,
+         ['caseid', 'v201', 'v525', 'v531']),
+
+    # 5. Marriage/partnership
+    Rule('never_married_children', 'info', 'Never married but has children',
+         lambda m: (m.v501 == 0) & m.has_children,
+         ['caseid', 'v501', 'v201']),
+    Rule('married_no_partner_age', 'info', 'In union but partner age missing',
+         lambda m: np.isin(m.v501, [1, 2]) & (np.isnan(m.v701) | (m.v701 == 0)),
+         ['caseid', 'v501', 'v701']),
+
+    # 6. Statistical outliers
+    Rule('large_sex_birth_gap', 'info', 'First sex to first birth > 15 years',
+         lambda m: m.has_both & (m.v531 - m.v525 > 15),
+         ['caseid', 'v525', 'v531']),
+    Rule('very_young_mother', 'warning', 'Very young mother (<14)',
+         lambda m: (m.v531 > 0) & (m.v531 < 14),
+         ['caseid', 'v525', 'v531', 'v012', 'v201']),
+
+    # 7. Sampling weights
+    Rule('missing_weight', 'warning', 'Missing or zero sampling weight',
+         lambda m: np.isnan(m.v005) | (m.v005 == 0),
+         ['caseid', 'v005']),
+    Rule('extreme_weight', 'info', 'Sampling weight >3 IQR from quartiles',
+         lambda m: (m.v005 < m.params['weight_low']) | (m.v005 > m.params['weight_high']),
+         ['caseid', 'v005']),
+]
+
+RULES_BY_NAME = {rule.name: rule for rule in RULES}
+
+# ===== VIOLATION BITMAP =====
+# One bit per rule (its position in RULES), packed into one integer per row
+RULE_BITS = {rule.name: bit for bit, rule in enumerate(RULES)}
+BITMAP_DTYPE = next(np.dtype(dtype) for dtype in ('uint8', 'uint16', 'uint32', 'uint64')
+                    if np.dtype(dtype).itemsize * 8 >= len(RULES))
+
+
+def rule_mask(*names):
+    """Integer with the bits of the given rules set"""
+    mask = 0
+    for name in names:
+        mask |= 1 << RULE_BITS[name]
+    return BITMAP_DTYPE.type(mask)
+
+
+def select(bits, all_of=(), any_of=(), none_of=()):
+    """
+    Rows whose violation bitmap fails every rule in `all_of`, at least one
+    rule in `any_of` and none of the rules in `none_of`.
+
+    Example: select(bits, all_of=['birth_before_sex', 'children_no_sex'],
+                    none_of=['very_young_mother'])
+    """
+    selected = np.ones(len(bits), dtype=bool)
+    if all_of:
+        required = rule_mask(*all_of)
+        selected &= (bits & required) == required
+    if any_of:
+        selected &= (bits & rule_mask(*any_of)) != 0
+    if none_of:
+        selected &= (bits & rule_mask(*none_of)) == 0
+    return selected
+
+
+def rows_from_bits(bits, rules=RULES):
+    """Row positions per rule from a violation bitmap"""
+    return {rule.name: np.flatnonzero(bits & rule_mask(rule.name)) for rule in rules}
+
+
+def describe_bits(bits, rules=RULES, separator='; '):
+    """Labels of the failed rules of each row, joined into one string"""
+    labels = pd.Series('', index=range(len(bits)), dtype=object)
+    for rule in rules:
+        failed = (bits & rule_mask(rule.name)) != 0
+        labels[failed] = labels[failed] + np.where(labels[failed] == '', '', separator) + rule.label
+    return labels.to_numpy()
+
+# Rules that compare against dataset-wide parameters from compute_params()
+PARAM_RULES = {'extreme_weight'}
+
+
+def compute_params(data):
+    """Dataset-wide quantities some rules compare against (e.g. weight fences)"""
+    params = {'weight_low': -np.inf, 'weight_high': np.inf}
+    if 'v005' in data.columns and data['v005'].notna().any():
+        weight_stats = data['v005'].describe()
+        iqr = weight_stats['75%'] - weight_stats['25%']
+        params['weight_low'] = weight_stats['25%'] - 3 * iqr
+        params['weight_high'] = weight_stats['75%'] + 3 * iqr
+    return params
+
+
+class RuleResults:
+    """Violation count, row positions and per-row bitmap of every evaluated rule"""
+
+    def __init__(self, rows, context, rules, bits=None):
+        self.rows = rows
+        self.context = context
+        self.rules = {rule.name: rule for rule in rules}
+        self._bits = bits
+
+    @property
+    def bits(self):
+        """Per-row violation bitmap (bit RULE_BITS[name] set when the row fails that rule)"""
+        if self._bits is None:
+            bits = np.zeros(len(self.context.data), dtype=BITMAP_DTYPE)
+            for name, rows in self.rows.items():
+                bits[rows] |= rule_mask(name)
+            self._bits = bits
+        return self._bits
+
+    def count(self, name):
+        return len(self.rows[name])
+
+    def mask(self, name):
+        """Boolean array marking the rows that fail a rule"""
+        mask = np.zeros(len(self.context.data), dtype=bool)
+        mask[self.rows[name]] = True
+        return mask
+
+    def counts(self):
+        """Violation counts as a Series indexed by rule name"""
+        return pd.Series({name: len(rows) for name, rows in self.rows.items()}, dtype=int)
+
+    def frame(self, data, name, columns=None):
+        """Violating rows of `data` (export columns of the rule by default)"""
+        columns = self.rules[name].columns if columns is None else columns
+        return data.iloc[self.rows[name]][columns]
+
+    def select(self, all_of=(), any_of=(), none_of=()):
+        """Boolean row mask from a bitwise query over the rule results"""
+        return select(self.bits, all_of, any_of, none_of)
+
+
+def evaluate_rules(data, rules=RULES, params=None):
+    """Evaluate all rules in one pass and return their violation rows"""
+    params = compute_params(data) if params is None else params
+    context = MaskContext(data, params)
+
+    rows = {}
+    for rule in rules:
+        mask = np.asarray(rule.expression(context), dtype=bool)
+        rows[rule.name] = np.flatnonzero(mask)
+    return RuleResults(rows, context, rules)
+
+
+# ===== PARALLEL SHARDED EVALUATION =====
+
+def _shareable_columns(data, exclude=('caseid',)):
+    """Numeric columns as-is and label columns as category codes, ready for shared memory"""
+    arrays, categories = {}, {}
+    for col in data.columns:
+        if col in exclude:
+            continue
+        values = data[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            arrays[col] = values.cat.codes.to_numpy()
+            categories[col] = list(values.cat.categories)
+        elif pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_extension_array_dtype(values):
+            arrays[col] = values.to_numpy()
+        elif pd.api.types.is_numeric_dtype(values):
+            arrays[col] = values.to_numpy(dtype=float, na_value=np.nan)
+        else:
+            labels = pd.Categorical(values)
+            arrays[col] = labels.codes
+            categories[col] = list(labels.categories)
+    return arrays, categories
+
+
+def shard_bounds(n_rows, n_shards, keys=None):
+    """Split rows into contiguous ranges; with sorted `keys`, never split a key value"""
+    cuts = np.linspace(0, n_rows, n_shards + 1).astype(int)[1:-1]
+    if keys is not None and len(cuts):
+        # Move each cut back to the first row of its cluster
+        cuts = np.searchsorted(keys, keys[cuts], side='left')
+    bounds = np.unique(np.concatenate([[0], cuts, [n_rows]]))
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _evaluate_shard(task):
+    """Worker: evaluate rules on rows [start, end) of the shared columns"""
+    from shared_arrays import worker_arrays
+
+    start, end, rule_names, params, categories = task
+    columns = {}
+    for name, values in worker_arrays().items():
+        part = values[start:end]
+        if name in categories:
+            columns[name] = pd.Categorical.from_codes(part, categories[name])
+        else:
+            columns[name] = part
+    shard = pd.DataFrame(columns, copy=False)
+
+    results = evaluate_rules(shard, [RULES_BY_NAME[name] for name in rule_names], params)
+    return {name: rows + start for name, rows in results.rows.items()}
+
+
+def evaluate_rules_parallel(data, workers=None, shard_by='v001', rules=RULES, params=None,
+                            shards_per_worker=4):
+    """
+    Evaluate rules on row shards across a process pool.
+
+    Rows are grouped by `shard_by` (e.g. cluster v001, or a file/wave column)
+    so no group is split across shards; it must be a column of `data`, or
+    None to shard by row position. Columns reach the workers through
+    shared memory rather than pickled DataFrames. Only rules registered in
+    RULES_BY_NAME can be sent to workers. Merged row positions are sorted,
+    so counts, samples and exports match the single-process evaluation.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from shared_arrays import SharedArrays, attach_worker
+
+    workers = workers or os.cpu_count() or 1
+    params = compute_params(data) if params is None else params
+    rule_names = [rule.name for rule in rules]
+
+    # Put rows of the same shard key next to each other (no-op if already sorted)
+    order, keys = None, None
+    if shard_by is not None:
+        if shard_by not in data.columns:
+            raise ValueError(f"shard_by column {shard_by!r} is not in the data")
+        keys = data[shard_by].to_numpy()
+        if np.any(keys[1:] < keys[:-1]):
+            order = np.argsort(keys, kind='stable')
+            keys = keys[order]
+
+    arrays, categories = _shareable_columns(data)
+    if order is not None:
+        arrays = {name: values[order] for name, values in arrays.items()}
+
+    tasks = [(start, end, rule_names, params, categories)
+             for start, end in shard_bounds(len(data), workers * shards_per_worker, keys)]
+
+    parts = {name: [] for name in rule_names}
+    with SharedArrays(arrays) as shared:
+        with ProcessPoolExecutor(max_workers=workers, initializer=attach_worker,
+                                 initargs=(shared.descriptors,)) as pool:
+            for shard_rows in pool.map(_evaluate_shard, tasks):
+                for name, rows in shard_rows.items():
+                    parts[name].append(rows)
+
+    rows = {}
+    for name in rule_names:
+        merged = np.concatenate(parts[name]) if parts[name] else np.array([], dtype=int)
+        if order is not None:
+            merged = order[merged]
+        rows[name] = np.sort(merged)
+    return RuleResults(rows, MaskContext(data, params), rules)
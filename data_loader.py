@@ -0,0 +1,130 @@
+"""
+SHARED DATASET LOADER
+=====================
+
+Every analysis script reads the same survey CSVs but only touches a handful
+of v-codes. This loader converts a CSV to a columnar Parquet cache on first
+use and afterwards reads only the requested columns from the cache.
+
+The cache lives in a `.dhs_cache/` folder next to the CSV and records the
+size and modification time of the CSV it was built from, so it is rebuilt
+automatically whenever the source file changes. If pyarrow is not installed
+the loader falls back to `pd.read_csv(usecols=...)`.
+
+Columns documented in the data dictionary get the compact dtypes from
+`dhs_schema.py` (int8/int16 codes, Categorical labels) before caching.
+
+Usage:
+    from data_loader import load_dataset
+    data = load_dataset('rwanda_dhs_CLEANED_minimal.csv', columns=['v525', 'v531'])
+    data = load_dataset('rwanda_dhs_CLEANED_minimal.csv', columns=['v012'], optional=['v022'])
+"""
+
+import os
+import json
+
+import pandas as pd
+
+from dhs_schema import apply_schema as apply_dtype_schema, build_schema, schema_version
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pq = None
+
+CACHE_DIR = '.dhs_cache'
+FINGERPRINT_KEY = b'dhs_source_fingerprint'
+
+
+def source_fingerprint(csv_path, schema=True):
+    """Return a small dict identifying the current version of a source file"""
+    stat = os.stat(csv_path)
+    return {
+        'file': os.path.basename(csv_path),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'schema': schema_version() if schema else None,
+    }
+
+
+def cache_path_for(csv_path, suffix='.parquet'):
+    """Location of the columnar cache file for a given CSV"""
+    folder = os.path.join(os.path.dirname(os.path.abspath(csv_path)), CACHE_DIR)
+    return os.path.join(folder, os.path.basename(csv_path) + suffix)
+
+
+def _cache_is_fresh(cache_file, fingerprint):
+    """Check that the cache exists and was built from the current CSV"""
+    if not os.path.exists(cache_file):
+        return False
+    try:
+        metadata = pq.read_schema(cache_file).metadata or {}
+    except Exception:
+        return False
+    stored = metadata.get(FINGERPRINT_KEY)
+    return stored is not None and json.loads(stored) == fingerprint
+
+
+def build_cache(csv_path, cache_file=None, schema=True):
+    """Parse the CSV once and write it to the columnar cache"""
+    import pyarrow as pa
+
+    cache_file = cache_file or cache_path_for(csv_path, '.parquet' if schema else '.raw.parquet')
+    fingerprint = source_fingerprint(csv_path, schema)
+    data = pd.read_csv(csv_path, low_memory=False)
+    if schema:
+        data = apply_dtype_schema(data, build_schema())
+
+    table = pa.Table.from_pandas(data, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[FINGERPRINT_KEY] = json.dumps(fingerprint).encode('utf-8')
+    table = table.replace_schema_metadata(metadata)
+
+    # Write to a temporary file first so a crash never leaves a half cache
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    tmp_file = cache_file + f'.tmp{os.getpid()}'
+    pq.write_table(table, tmp_file)
+    os.replace(tmp_file, cache_file)
+    return cache_file
+
+
+def dataset_columns(csv_path):
+    """Column names of a source CSV (read from its header only)"""
+    return list(pd.read_csv(csv_path, nrows=0).columns)
+
+
+def _load_one(csv_path, columns, use_cache, schema, optional=()):
+    """Load a single CSV, going through the cache when possible"""
+    if columns is not None and optional:
+        available = set(dataset_columns(csv_path))
+        columns = columns + [col for col in optional if col in available and col not in columns]
+
+    if pq is None or not use_cache:
+        data = pd.read_csv(csv_path, usecols=columns, low_memory=False)
+        return apply_dtype_schema(data, build_schema()) if schema else data
+
+    cache_file = cache_path_for(csv_path, '.parquet' if schema else '.raw.parquet')
+    if not _cache_is_fresh(cache_file, source_fingerprint(csv_path, schema)):
+        build_cache(csv_path, cache_file, schema)
+    return pd.read_parquet(cache_file, columns=columns)
+
+
+def load_dataset(csv_path, columns=None, use_cache=True, schema=True, optional=()):
+    """
+    Load a survey dataset, reading only `columns` when given.
+
+    `optional` columns are added to `columns` only when the source has them
+    (e.g. survey strata that older extracts do not carry).
+
+    `csv_path` may also be a list of CSV files (e.g. several DHS waves);
+    they are loaded one by one and stacked into a single DataFrame.
+    Pass `schema=False` to keep pandas' default float64/object dtypes.
+    """
+    columns = list(columns) if columns is not None else None
+
+    if isinstance(csv_path, (list, tuple)):
+        frames = [_load_one(path, columns, use_cache, schema, optional) for path in csv_path]
+        data = pd.concat(frames, ignore_index=True)
+        # Waves can disagree on categories or NaN-ness; re-compact the stack
+        return apply_dtype_schema(data, build_schema()) if schema else data
+    return _load_one(csv_path, columns, use_cache, schema, optional)
@@ -0,0 +1,229 @@
+"""
+SPARSE DESIGN MATRIX FROM THE DATA DICTIONARY
+=============================================
+
+Nominal DHS codes (province v024, religion v130, ethnicity v131, building
+materials v127-v129, ...) carry no order, so the linear models must not read
+them as numbers. The data dictionary decides how every variable enters the
+design matrix:
+
+- continuous: floats (v191) and measured quantities documented by a range
+  and a unit ("15-49 (years)", "0-20+ (total years)") -> one column as is
+- ordinal: labelled codes with a natural order (ORDINAL_CODES: education,
+  wealth quintiles, media frequency, ...) -> one column with the code
+- binary: two labelled codes (0=No/1=Yes, 1=Urban/2=Rural) -> one 0/1
+  indicator of the "Yes" code (else the higher code); a binary variable
+  holding other codes at fit time (7/8/9 = not resident, don't know,
+  missing) is encoded as nominal instead, so those codes never read as No
+- nominal: any other labelled or unlabelled code list ("10-39=Various floor
+  types", "Country-specific ethnic group codes") -> one-hot block, the lowest
+  level being the reference (drop_first=True)
+
+The encoder is fitted once (levels seen in the data) and then transforms any
+frame to a CSR matrix with the same columns: levels unseen at fit time give
+an all-zero block. Feature names are "<variable>" for single columns and
+"<variable>=<level>" for one-hot columns, and `groups` maps every column back
+to its variable. The fitted encoding saves to JSON, so later models rebuild
+exactly the same columns.
+
+Usage:
+    encoder = DesignEncoder().fit(X_imputed)
+    design = encoder.transform(X_imputed)        # scipy.sparse CSR
+    encoder.feature_names, encoder.groups
+    encoder.save('Design_Matrix_Encoding.json')
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+
+# Labelled codes whose order is meaningful (kept as a single numeric column)
+ORDINAL_CODES = {
+    'v013',                     # 5-year age group
+    'v106', 'v149',             # education level / attainment
+    'v157', 'v158', 'v159',     # media exposure frequency
+    'v190', 'v190a',            # wealth quintiles
+    'age_group', 'education_category', 'wealth_category',
+}
+
+
+def measurement_levels(dictionary=None):
+    """{variable_name: measurement level} for every numeric or labelled variable in the dictionary"""
+    from dhs_schema import TYPE_KINDS, parse_value_labels
+    from data_dictionary_analysis import dict_df
+
+    dictionary = dict_df if dictionary is None else dictionary
+    levels = {}
+    for row in dictionary.itertuples(index=False):
+        kind = TYPE_KINDS.get(row.variable_type, 'string')
+        if kind == 'string':
+            continue
+        _, labels = parse_value_labels(row.value_labels)
+        if kind == 'float':
+            level = 'continuous'
+        elif row.variable_name in ORDINAL_CODES:
+            level = 'ordinal'
+        elif kind == 'category':
+            level = 'nominal'
+        elif len(labels) == 2:
+            level = 'binary'
+        elif labels:
+            level = 'nominal'
+        else:
+            # A bare range with a unit ("0-20+ (total years)") is a measured quantity,
+            # anything else ("10-39=Various floor types", "... group codes") a code list
+            measured = '(' in row.value_labels and '=' not in row.value_labels
+            level = 'continuous' if measured else 'nominal'
+        levels[row.variable_name] = level
+    return levels
+
+
+def positive_codes(dictionary=None):
+    """{variable_name: indicator code} of the two-code variables: the "Yes" code, else the higher one"""
+    from dhs_schema import TYPE_KINDS, parse_value_labels
+    from data_dictionary_analysis import dict_df
+
+    dictionary = dict_df if dictionary is None else dictionary
+    positive = {}
+    for row in dictionary.itertuples(index=False):
+        if TYPE_KINDS.get(row.variable_type, 'string') == 'string':
+            continue
+        _, labels = parse_value_labels(row.value_labels)
+        if len(labels) == 2:
+            yes = [code for code, label in labels.items() if label.lower() == 'yes']
+            positive[row.variable_name] = (sorted(set(labels) - set(yes)) + yes) if yes else sorted(labels)
+    return positive
+
+
+def _level_name(level):
+    return str(int(level)) if isinstance(level, float) and level.is_integer() else str(level)
+
+
+class DesignEncoder:
+    """Dictionary-driven one-hot / numeric encoding of predictors into a CSR design matrix"""
+
+    def __init__(self, levels=None, drop_first=True, binary_codes=None):
+        self.declared = measurement_levels() if levels is None else dict(levels)
+        self.binary_codes = positive_codes() if binary_codes is None else dict(binary_codes)
+        self.drop_first = drop_first
+        self.measurement = {}  # variable -> level used at fit
+        self.variables = []
+        self.categories = {}  # variable -> [other, indicator] code (binary), levels (nominal, ordinal labels)
+        self.feature_names = []
+        self.groups = []
+
+    def _level_of(self, var, values):
+        if var in self.declared:
+            return self.declared[var]
+        numeric = pd.api.types.is_numeric_dtype(values.dtype) and not isinstance(values.dtype, pd.CategoricalDtype)
+        return 'continuous' if numeric else 'nominal'
+
+    def fit(self, data, variables=None):
+        """Learn each variable's measurement level and levels from a complete frame; returns self"""
+        self.variables = list(data.columns if variables is None else variables)
+        self.measurement, self.categories = {}, {}
+        for var in self.variables:
+            values = data[var]
+            level = self._level_of(var, values)
+            seen = sorted(values.dropna().unique().tolist())
+            if level == 'binary':
+                codes = self.binary_codes.get(var)
+                if codes is not None and set(seen) <= set(codes):
+                    self.categories[var] = list(codes)
+                elif codes is None and len(seen) <= 2:
+                    self.categories[var] = seen
+                else:
+                    level = 'nominal'  # special codes next to No/Yes get their own columns
+            if level == 'nominal':
+                self.categories[var] = seen
+            elif level == 'ordinal' and isinstance(values.dtype, pd.CategoricalDtype):
+                # Labelled strings are ranked in dictionary order
+                self.categories[var] = list(values.cat.categories)
+            self.measurement[var] = level
+        self._name_columns()
+        return self
+
+    def _name_columns(self):
+        self.feature_names, self.groups = [], []
+        for var in self.variables:
+            if self.measurement[var] == 'nominal':
+                levels = self.categories[var][1:] if self.drop_first else self.categories[var]
+                names = [f'{var}={_level_name(level)}' for level in levels]
+            else:
+                names = [var]
+            self.feature_names += names
+            self.groups += [var] * len(names)
+
+    def transform(self, data):
+        """CSR design matrix of a complete frame (missing values must be imputed first)"""
+        from scipy import sparse
+
+        n = len(data)
+        row_ids = np.arange(n)
+        rows, cols, values = [], [], []
+        column = 0
+        for var in self.variables:
+            series = data[var]
+            if series.isna().any():
+                raise ValueError(f"{var} has missing values; impute before encoding")
+            level = self.measurement[var]
+            if level == 'nominal':
+                codes = pd.Categorical(series, categories=self.categories[var]).codes.astype(np.int64)
+                present = codes >= (1 if self.drop_first else 0)
+                rows.append(row_ids[present])
+                cols.append(column + codes[present] - (1 if self.drop_first else 0))
+                values.append(np.ones(present.sum()))
+                column += len(self.categories[var]) - (1 if self.drop_first else 0)
+                continue
+
+            if level == 'binary':
+                column_values = (series.to_numpy() == self.categories[var][-1]).astype(float)
+            elif var in self.categories:
+                column_values = pd.Categorical(series, categories=self.categories[var]).codes.astype(float)
+            else:
+                column_values = series.to_numpy(dtype=float)
+            rows.append(row_ids)
+            cols.append(np.full(n, column))
+            values.append(column_values)
+            column += 1
+
+        design = sparse.csr_matrix((np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))),
+                                   shape=(n, column))
+        design.eliminate_zeros()
+        return design
+
+    def fit_transform(self, data, variables=None):
+        return self.fit(data, variables).transform(data)
+
+    def group_sizes(self):
+        """Number of design columns of every variable"""
+        return pd.Series(self.groups).value_counts(sort=False).reindex(self.variables)
+
+    def to_dict(self):
+        return {
+            'drop_first': self.drop_first,
+            'variables': self.variables,
+            'measurement': {var: self.measurement[var] for var in self.variables},
+            'categories': self.categories,
+        }
+
+    @classmethod
+    def from_dict(cls, spec):
+        encoder = cls(spec['measurement'], spec['drop_first'], binary_codes={})
+        encoder.variables = list(spec['variables'])
+        encoder.measurement = dict(spec['measurement'])
+        encoder.categories = {var: list(levels) for var, levels in spec['categories'].items()}
+        encoder._name_columns()
+        return encoder
+
+    def save(self, path):
+        """Write the fitted encoding to JSON"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
@@ -0,0 +1,91 @@
+"""
+UNIFIED COMMAND LINE FOR THE ANALYSIS SCRIPTS
+=============================================
+
+One entry point for every stage of the workflow. The CLI itself only uses the
+standard library; a subcommand imports its script (and with it pandas, scipy,
+sklearn, statsmodels or plotting libraries) only when it runs, so quick
+checks do not pay for the heavy stages. Arguments after the subcommand are
+passed to the script unchanged.
+
+Start-up and per-command timings, and the heavy libraries a command ended up
+loading, are reported on stderr.
+
+Usage:
+    python dhs_cli.py check                      (consistency checks only)
+    python dhs_cli.py clean --stream
+    python dhs_cli.py eda
+    python dhs_cli.py cube --by education_category --where v024=East
+    python dhs_cli.py serve --port 8765
+    python dhs_cli.py pipeline --dry-run
+    python dhs_cli.py features                   (executes the feature selection notebook)
+"""
+
+import time
+
+_START = time.perf_counter()
+
+import sys
+import runpy
+import argparse
+import subprocess
+from collections import namedtuple
+
+Command = namedtuple('Command', ['module', 'help'])
+
+COMMANDS = {
+    'dictionary': Command('data_dictionary_analysis', 'Build the data dictionary report and exports'),
+    'ingest': Command('dhs_ingest', 'Ingest a raw DHS file into the analysis dataset'),
+    'check': Command('check_data_consistency', 'Run the data consistency checks'),
+    'clean': Command('cleaning_impossibl_case', 'Exclude impossible cases and write the cleaned dataset'),
+    'eda': Command('EDA_Analysis', 'Exploratory data analysis report'),
+    'cube': Command('aggregate_cube', 'Query the subgroup aggregate cube'),
+    'serve': Command('eda_server', 'Serve subgroup queries as JSON'),
+    'pipeline': Command('pipeline', 'Run the pipeline, skipping unchanged stages'),
+    'features': Command(None, 'Execute the feature selection notebook'),
+}
+
+# Libraries worth reporting when a command loads them
+HEAVY_MODULES = ['pandas', 'scipy', 'sklearn', 'statsmodels', 'matplotlib', 'seaborn', 'pyarrow']
+
+
+def _report(message):
+    print(f"⏱  {message}", file=sys.stderr)
+
+
+def run_command(name, args):
+    """Run a subcommand's script as __main__ with `args`; returns its exit code"""
+    command = COMMANDS[name]
+    if command.module is None:
+        from pipeline import ROOT, STAGES_BY_NAME
+        # The notebook opens its inputs by relative path, as in pipeline.run_stage
+        return subprocess.call(STAGES_BY_NAME['feature_selection'].command + args, cwd=ROOT)
+
+    sys.argv = [command.module + '.py'] + args
+    try:
+        runpy.run_module(command.module, run_name='__main__', alter_sys=True)
+    except SystemExit as exit_:
+        return exit_.code if isinstance(exit_.code, int) else (0 if exit_.code is None else 1)
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Rwanda DHS analysis workflow',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='\n'.join(f'  {name:12s} {command.help}' for name, command in COMMANDS.items()))
+    parser.add_argument('command', choices=list(COMMANDS), metavar='command')
+    parser.add_argument('args', nargs=argparse.REMAINDER, help='Arguments passed to the command')
+    args = parser.parse_args(argv)
+
+    _report(f"CLI ready in {(time.perf_counter() - _START) * 1000:.0f} ms")
+    start = time.perf_counter()
+    code = run_command(args.command, args.args)
+    loaded = [name for name in HEAVY_MODULES if name in sys.modules]
+    _report(f"{args.command} finished in {time.perf_counter() - start:.2f}s "
+            f"(libraries loaded: {', '.join(loaded) or 'none'})")
+    return code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
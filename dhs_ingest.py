@@ -0,0 +1,206 @@
+"""
+STREAMING INGESTION OF THE RAW DHS INDIVIDUAL RECODE
+====================================================
+
+Rebuilds the analysis dataset (`rwanda_early_sexual_debut_dataset.csv`)
+directly from the raw women's recode (e.g. RWIR81FL) without ever holding
+the ~4,000-column file in memory:
+
+1. Only the DHS v-codes documented in the data dictionary are read
+   (plus the design variables v022/v023 when present)
+2. The recode is read in chunks of rows
+3. Every 'Derived' variable of the data dictionary is computed vectorized
+   from the v-codes of each chunk
+4. Chunks are appended to the output CSV
+
+Supported inputs:
+- Stata recode (.DTA), read with `pd.read_stata(..., chunksize=...)`
+- Flat ASCII recode (.DAT) together with its Stata dictionary (.DCT),
+  read as fixed-width columns for the selected variables only
+
+Usage:
+    python dhs_ingest.py RWIR81FL.DTA
+    python dhs_ingest.py RWIR81FL.DAT --dct RWIR81FL.DCT -o rwanda_early_sexual_debut_dataset.csv
+    python dhs_ingest.py RWIR61FL.DTA RWIR81FL.DTA          (stacks several waves)
+"""
+
+import os
+import re
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from dhs_schema import build_schema
+
+OUTPUT_FILE = 'rwanda_early_sexual_debut_dataset.csv'
+DEFAULT_CHUNKSIZE = 2000
+
+# Survey design variables kept for variance estimation (not in the dictionary)
+DESIGN_VARS = ['v021', 'v022', 'v023']
+
+# Valid ages for v525 / v531: 1-49 (0 = never, 96-99 = special codes)
+VALID_AGE_MIN, VALID_AGE_MAX = 1, 49
+
+# Derived label column -> DHS code it labels
+LABELLED_CODES = {
+    'residence': 'v025',
+    'education_category': 'v106',
+    'wealth_category': 'v190',
+    'marital_status': 'v501',
+    'religion': 'v130',
+    'age_group': 'v013',
+}
+
+# Stata dictionary line: _column(16)  long  v001  %8f  "cluster number"
+DCT_PATTERN = re.compile(r'_column\((\d+)\)\s+(\S+)\s+(\w+)\s+%(\d+)(\w)')
+
+
+def raw_columns(schema=None):
+    """DHS v-codes that the analysis dataset keeps from the recode"""
+    schema = build_schema() if schema is None else schema
+    original = [name for name, spec in schema.items() if spec['source'] == 'DHS Original']
+    return original + DESIGN_VARS
+
+
+def derived_columns(schema=None):
+    """Derived variables in data dictionary order"""
+    schema = build_schema() if schema is None else schema
+    return [name for name, spec in schema.items() if spec['source'] == 'Derived']
+
+
+def _valid_age(values):
+    """Mask of valid ages (1-49) for v525 / v531"""
+    return (values >= VALID_AGE_MIN) & (values <= VALID_AGE_MAX)
+
+
+def _indicator(condition, defined):
+    """0/1 indicator that is NaN wherever `defined` is False"""
+    return np.where(defined, condition.astype(float), np.nan)
+
+
+def derive_variables(chunk, schema=None):
+    """Compute every derived variable of the data dictionary from the v-codes"""
+    schema = build_schema() if schema is None else schema
+    derived = {}
+
+    v525 = chunk['v525'].to_numpy(dtype=float)
+    had_sex = _valid_age(v525)
+    derived['early_sexual_debut'] = _indicator(v525 < 18, had_sex)
+    derived['very_early_debut'] = _indicator(v525 < 15, had_sex)
+
+    categories = schema['sexual_debut_category']['categories']  # Never / Early / Normal
+    debut = np.select([v525 == 0, had_sex & (v525 < 18), had_sex],
+                      categories, default=None)
+    derived['sexual_debut_category'] = debut
+
+    v531 = chunk['v531'].to_numpy(dtype=float)
+    had_birth = _valid_age(v531)
+    derived['early_first_birth'] = _indicator(v531 < 18, had_birth)
+    derived['teen_pregnancy'] = _indicator(v531 < 20, had_birth)
+
+    derived['ever_given_birth'] = (chunk['v201'].to_numpy(dtype=float) > 0).astype(int)
+    derived['sample_weight'] = chunk['v005'].to_numpy(dtype=float) / 1_000_000
+
+    # Labelled versions of DHS codes, using the code labels of the dictionary
+    for label_col, code_col in LABELLED_CODES.items():
+        if code_col not in chunk.columns:
+            continue
+        value_labels = schema[code_col]['value_labels']
+        derived[label_col] = chunk[code_col].map(value_labels).to_numpy()
+
+    derived = pd.DataFrame(derived, index=chunk.index)
+    order = [col for col in derived_columns(schema) if col in derived.columns]
+    return pd.concat([chunk, derived[order]], axis=1)
+
+
+def read_dct(dct_path):
+    """Parse a Stata .DCT dictionary into {variable: (start, width, is_string)}"""
+    layout = {}
+    with open(dct_path, encoding='latin-1') as f:
+        for line in f:
+            match = DCT_PATTERN.search(line)
+            if match:
+                start, storage, name, width, fmt = match.groups()
+                layout[name.lower()] = (int(start) - 1, int(width), storage.startswith('str'))
+    return layout
+
+
+def iter_recode_chunks(source, columns, chunksize=DEFAULT_CHUNKSIZE, dct_path=None):
+    """Yield DataFrames of `columns` (those present in the recode) from a raw recode"""
+    extension = os.path.splitext(source)[1].lower()
+
+    if extension == '.dta':
+        with pd.read_stata(source, iterator=True, convert_categoricals=False,
+                           convert_missing=False) as reader:
+            available = set(reader.variable_labels())
+        wanted = [col for col in columns if col in available]
+        with pd.read_stata(source, chunksize=chunksize, columns=wanted,
+                           convert_categoricals=False, convert_missing=False) as reader:
+            for chunk in reader:
+                yield chunk
+
+    elif extension == '.dat':
+        dct_path = dct_path or os.path.splitext(source)[0] + '.DCT'
+        layout = read_dct(dct_path)
+        wanted = [col for col in columns if col in layout]
+        colspecs = [(layout[col][0], layout[col][0] + layout[col][1]) for col in wanted]
+        dtypes = {col: str for col in wanted if layout[col][2]}
+        reader = pd.read_fwf(source, colspecs=colspecs, names=wanted, header=None,
+                             dtype=dtypes, chunksize=chunksize, encoding='latin-1')
+        for chunk in reader:
+            yield chunk
+
+    else:
+        raise ValueError(f"Unsupported recode format: {source} (expected .DTA or .DAT)")
+
+
+def ingest_recode(sources, output_file=OUTPUT_FILE, chunksize=DEFAULT_CHUNKSIZE, dct_path=None):
+    """Stream one or more raw recodes into the analysis dataset CSV"""
+    if isinstance(sources, str):
+        sources = [sources]
+
+    schema = build_schema()
+    columns = raw_columns(schema)
+    output_columns = None
+    n_rows = 0
+
+    tmp_file = output_file + '.partial'
+    if os.path.exists(tmp_file):
+        os.remove(tmp_file)
+
+    for source in sources:
+        print(f"\nReading {source} ...")
+        for chunk in iter_recode_chunks(source, columns, chunksize, dct_path):
+            chunk = derive_variables(chunk, schema)
+
+            # Waves can miss some variables; keep the first wave's layout
+            if output_columns is None:
+                output_columns = list(chunk.columns)
+            chunk = chunk.reindex(columns=output_columns)
+
+            chunk.to_csv(tmp_file, mode='a', header=(n_rows == 0), index=False)
+            n_rows += len(chunk)
+            print(f"  ✓ {n_rows:,} rows written", end='\r')
+        print()
+
+    os.replace(tmp_file, output_file)
+    return n_rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build the analysis dataset from raw DHS recodes')
+    parser.add_argument('sources', nargs='+', help='Raw recode files (.DTA, or .DAT with a .DCT)')
+    parser.add_argument('-o', '--output', default=OUTPUT_FILE, help='Output CSV')
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE, help='Rows per chunk')
+    parser.add_argument('--dct', default=None, help='Stata dictionary for a .DAT recode')
+    args = parser.parse_args()
+
+    print("="*80)
+    print("STREAMING INGESTION OF RAW DHS RECODE")
+    print("="*80)
+
+    n_rows = ingest_recode(args.sources, args.output, args.chunksize, args.dct)
+
+    print(f"\n✓ Analysis dataset saved: {args.output}")
+    print(f"  N = {n_rows:,} observations")
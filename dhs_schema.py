@@ -0,0 +1,164 @@
+"""
+COMPACT DTYPE SCHEMA FROM THE DATA DICTIONARY
+=============================================
+
+Turns the variables documented in `data_dictionary_analysis.py` into a
+machine-readable schema and uses it to give loaded data compact dtypes:
+
+- Small-range DHS codes (v525, v531, v012, v106, v190, ...) -> int8/int16
+  (float32 when the column has missing values)
+- Binary indicators (ever_given_birth, ...) -> int8; indicators with missing
+  values (early_sexual_debut, teen_pregnancy, ...) stay float64 so that
+  prevalence means keep full precision
+- Labelled strings (education_category, wealth_category, residence,
+  sexual_debut_category, ...) -> pandas Categorical in dictionary order
+- Continuous floats (v191, sample_weight) and caseid are left unchanged
+
+The integer width is taken from the code range in the dictionary and widened
+if the data contains larger values, so no value is ever truncated.
+
+Run as a script to export the schema to `rwanda_dhs_schema.json`.
+"""
+
+import re
+import json
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from data_dictionary_analysis import dict_df
+
+SCHEMA_FILE = 'rwanda_dhs_schema.json'
+
+# Dictionary variable_type -> schema kind
+TYPE_KINDS = {
+    'String': 'string',
+    'Numeric': 'code',
+    'Numeric (Float)': 'float',
+    'Binary': 'binary',
+    'Categorical': 'category',
+}
+
+# Integers in a value-label string ("1-49=Age", "-25 to +50", "0-20+")
+NUMBER_PATTERN = re.compile(r'(?:(?<![0-9])-)?\d+')
+# Single labelled codes ("1=Urban, 2=Rural")
+LABEL_PATTERN = re.compile(r'(?:^|, )(-?\d+)=(.*?)(?=, (?:-?\d+(?:-\d+)?\+?|NaN)=|$)')
+
+INT_DTYPES = ['int8', 'int16', 'int32', 'int64']
+
+
+def parse_value_labels(text):
+    """Extract the declared code range and the labelled codes from a value-label string"""
+    numbers = [int(n) for n in NUMBER_PATTERN.findall(text)]
+    labels = {int(code): label.strip() for code, label in LABEL_PATTERN.findall(text)}
+    code_range = (min(numbers), max(numbers)) if numbers else None
+    return code_range, labels
+
+
+def build_schema(dictionary=None):
+    """Build the schema as {variable_name: spec} from the data dictionary"""
+    dictionary = dict_df if dictionary is None else dictionary
+
+    schema = {}
+    for row in dictionary.itertuples(index=False):
+        kind = TYPE_KINDS.get(row.variable_type, 'string')
+        spec = {
+            'label': row.variable_label,
+            'kind': kind,
+            'source': row.source,
+        }
+
+        if kind == 'category':
+            spec['categories'] = [c.strip() for c in row.value_labels.split(', ')]
+        elif kind in ('code', 'binary'):
+            code_range, labels = parse_value_labels(row.value_labels)
+            spec['range'] = list(code_range) if code_range else None
+            spec['value_labels'] = labels
+
+        schema[row.variable_name] = spec
+    return schema
+
+
+def schema_version(schema=None):
+    """Short hash identifying the schema (used to invalidate dataset caches)"""
+    schema = build_schema() if schema is None else schema
+    payload = json.dumps(schema, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.sha1(payload).hexdigest()[:12]
+
+
+def save_schema(path=SCHEMA_FILE, schema=None):
+    """Write the schema to JSON"""
+    schema = build_schema() if schema is None else schema
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(schema, f, indent=2, ensure_ascii=False)
+    return path
+
+
+def smallest_int_dtype(low, high):
+    """Smallest signed integer dtype that holds every value in [low, high]"""
+    for dtype in INT_DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return dtype
+    return 'int64'
+
+
+def _compact_numeric(values, spec):
+    """Downcast an integer-coded column, or return it unchanged if not integral"""
+    if not pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+        return values
+
+    observed = values.dropna()
+    if len(observed) and not np.array_equal(observed, np.round(observed)):
+        return values  # Not integer codes after all - leave untouched
+
+    if values.isna().any():
+        if spec['kind'] == 'binary':
+            return values
+        # float32 holds every integer up to 2**24 exactly
+        return values.astype('float32')
+
+    low, high = spec.get('range') or (0, 0)
+    if len(observed):
+        low, high = min(low, observed.min()), max(high, observed.max())
+    return values.astype(smallest_int_dtype(low, high))
+
+
+def _compact_category(values, spec):
+    """Convert a labelled string column to a Categorical in dictionary order"""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values
+    categories = list(spec['categories'])
+    # Keep any label the dictionary does not list instead of turning it into NaN
+    extra = sorted(set(values.dropna().unique()) - set(categories))
+    return values.astype(pd.CategoricalDtype(categories + extra))
+
+
+def apply_schema(data, schema=None):
+    """Return `data` with compact dtypes for every column known to the schema"""
+    schema = build_schema() if schema is None else schema
+
+    for col in data.columns:
+        spec = schema.get(col)
+        if spec is None:
+            continue
+        if spec['kind'] in ('code', 'binary'):
+            data[col] = _compact_numeric(data[col], spec)
+        elif spec['kind'] == 'category':
+            data[col] = _compact_category(data[col], spec)
+    return data
+
+
+if __name__ == '__main__':
+    schema = build_schema()
+    save_schema(SCHEMA_FILE, schema)
+
+    print("="*80)
+    print("DATA DICTIONARY SCHEMA")
+    print("="*80)
+    kinds = pd.Series({name: spec['kind'] for name, spec in schema.items()})
+    print(f"\nVariables in schema: {len(schema)}")
+    print(kinds.value_counts().to_string())
+    print(f"\nSchema version: {schema_version(schema)}")
+    print(f"✓ Schema saved as: {SCHEMA_FILE}")
@@ -0,0 +1,205 @@
+"""
+LOCAL JSON QUERY SERVICE OVER THE EDA AGGREGATES
+================================================
+
+Serves prevalences, counts and crosstabs for any subgroup from the
+in-memory aggregate cube (aggregate_cube.py), so dashboards no longer re-run
+EDA_Analysis.py. The cube is loaded (and incrementally refreshed) once at
+startup; every response is answered by summing cube cells and memoized in
+an LRU cache keyed on the normalized query. Standard library only
+(ThreadingHTTPServer), bound to localhost by default.
+
+Endpoints (GET, JSON):
+    /dimensions                                  levels of every dimension, outcomes
+    /counts?by=education_category,residence      unweighted and weighted N
+    /prevalence?outcome=early_sexual_debut&by=wealth_category&where=v024:East,residence:Rural
+    /crosstab?rows=education_category&cols=residence&outcome=teen_pregnancy&weighted=0
+
+`where` takes comma separated dim:level pairs; repeat a dimension to select
+several levels. `weighted` defaults to 1.
+
+Usage:
+    python eda_server.py --port 8765
+"""
+
+import json
+import time
+import argparse
+import functools
+from urllib.parse import urlsplit, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import numpy as np
+
+from aggregate_cube import DATA_FILE, DIMENSIONS, OUTCOMES, WEIGHT_COLUMN, load_cube
+from data_loader import load_dataset
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+CACHE_SIZE = 4096
+
+
+class QueryError(ValueError):
+    """Invalid query parameters (answered with HTTP 400)"""
+
+
+class UnknownEndpoint(Exception):
+    """Path that is not one of the endpoints (answered with HTTP 404)"""
+
+
+# ===== QUERY HANDLING =====
+
+def _records(frame):
+    """DataFrame -> list of JSON-ready dicts (NaN becomes null)"""
+    frame = frame.reset_index()
+    records = frame.to_dict(orient='records')
+    for record in records:
+        for key, value in record.items():
+            if isinstance(value, (float, np.floating)) and np.isnan(value):
+                record[key] = None
+            elif isinstance(value, np.integer):
+                record[key] = int(value)
+            elif isinstance(value, np.floating):
+                record[key] = float(value)
+    return records
+
+
+class QueryService:
+    """Answers normalized queries from an aggregate cube, with an LRU response cache"""
+
+    def __init__(self, cube):
+        self.cube = cube
+        self.answer = functools.lru_cache(maxsize=CACHE_SIZE)(self._answer)
+
+    def _dimensions(self, names):
+        dims = [name for name in names if name]
+        unknown = [name for name in dims if name not in self.cube.levels]
+        if unknown:
+            raise QueryError(f"unknown dimension(s): {', '.join(unknown)}")
+        return dims
+
+    def _where(self, pairs):
+        where = {}
+        for dim, level in pairs:
+            self._dimensions([dim])
+            if level not in self.cube.levels[dim]:
+                raise QueryError(f"unknown level for {dim}: {level}")
+            where.setdefault(dim, []).append(level)
+        return where
+
+    def _outcome(self, outcome):
+        if outcome not in self.cube.outcomes:
+            raise QueryError(f"unknown outcome: {outcome} (expected one of {', '.join(self.cube.outcomes)})")
+        return outcome
+
+    def _answer(self, endpoint, by, where_pairs, outcome, rows, cols, weighted):
+        """JSON bytes for one normalized query (arguments are hashable)"""
+        if endpoint == 'dimensions':
+            payload = {'dimensions': self.cube.levels, 'outcomes': self.cube.outcomes}
+        elif endpoint == 'counts':
+            result = self.cube.query(None, by=self._dimensions(by), where=self._where(where_pairs))
+            payload = {'by': list(by), 'rows': _records(result)}
+        elif endpoint == 'prevalence':
+            result = self.cube.query(self._outcome(outcome), by=self._dimensions(by),
+                                     where=self._where(where_pairs), weighted=weighted)
+            payload = {'outcome': outcome, 'weighted': weighted, 'by': list(by),
+                       'rows': _records(result)}
+        elif endpoint == 'crosstab':
+            row_dim, col_dim = self._dimensions([rows])[0:1], self._dimensions([cols])[0:1]
+            if not row_dim or not col_dim:
+                raise QueryError("crosstab needs 'rows' and 'cols'")
+            if row_dim == col_dim:
+                raise QueryError("crosstab needs different 'rows' and 'cols'")
+            value = 'n' if outcome is None else 'rate'
+            result = self.cube.query(outcome and self._outcome(outcome), by=row_dim + col_dim,
+                                     where=self._where(where_pairs), weighted=weighted)
+            table = result[value].unstack(col_dim[0])
+            payload = {'rows': rows, 'cols': cols, 'value': value, 'outcome': outcome,
+                       'weighted': weighted, 'columns': [str(c) for c in table.columns],
+                       'table': _records(table)}
+        else:
+            raise UnknownEndpoint(endpoint)
+        return json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+    def handle(self, path, query_string):
+        """Normalize a request and return JSON bytes"""
+        endpoint = path.strip('/')
+        params = {key: values[-1] for key, values in parse_qs(query_string).items()}
+        by = tuple(name for name in params.get('by', '').split(',') if name)
+        where_pairs = []
+        for item in params.get('where', '').split(','):
+            if item:
+                if ':' not in item:
+                    raise QueryError(f"where expects dim:level pairs, got {item!r}")
+                where_pairs.append(tuple(item.split(':', 1)))
+        weighted = params.get('weighted', '1') not in ('0', 'false', 'no')
+        # Repeated pairs would select (and count) the same cells twice
+        return self.answer(endpoint, by, tuple(sorted(set(where_pairs))), params.get('outcome'),
+                           params.get('rows'), params.get('cols'), weighted)
+
+
+# ===== HTTP =====
+
+class QueryServer(ThreadingHTTPServer):
+    """Threaded server with a listen backlog sized for bursts of dashboard requests"""
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def make_handler(service):
+    """Request handler class bound to a QueryService"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, status, body):
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            try:
+                self._send(200, service.handle(url.path, url.query))
+            except QueryError as error:
+                self._send(400, json.dumps({'error': str(error)}).encode('utf-8'))
+            except UnknownEndpoint:
+                self._send(404, json.dumps({'error': f'unknown endpoint {url.path}'}).encode('utf-8'))
+            except Exception as error:
+                self._send(500, json.dumps({'error': f'internal error: {error!r}'}).encode('utf-8'))
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, data_file=DATA_FILE):
+    """Load the cube for `data_file` and serve it until interrupted"""
+    start = time.perf_counter()
+    data = load_dataset(data_file, columns=['caseid', WEIGHT_COLUMN] + DIMENSIONS + OUTCOMES)
+    cube, n_updated = load_cube(data, data_file)
+    print(f"✓ Cube ready: {len(data):,} respondents ({n_updated:,} updated) "
+          f"in {time.perf_counter() - start:.2f}s")
+
+    server = QueryServer((host, port), make_handler(QueryService(cube)))
+    print(f"✓ Serving on http://{host}:{port}/  (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Local JSON query service over the EDA aggregates')
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--data', default=DATA_FILE, help='Cleaned dataset CSV')
+    args = parser.parse_args()
+
+    print("="*80)
+    print("EDA QUERY SERVICE")
+    print("="*80)
+    serve(args.host, args.port, args.data)
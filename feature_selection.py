@@ -0,0 +1,504 @@
+"""
+MULTI-METHOD FEATURE SELECTION
+==============================
+
+The feature selection of feacture_selection.ipynb as an importable module.
+Five independent methods score the candidate predictors of early sexual
+debut among sexually active women:
+
+1. Univariate tests: survey-weighted Rao-Scott chi-square (categorical) or
+   t-test (continuous); selected if p < 0.05
+2. Mutual information: plug-in estimate from contingency counts (top 20
+   with MI > 0)
+3. Random forest importance (top 20)
+4. Recursive feature elimination with logistic regression (feature count
+   chosen by 5-fold cross-validation)
+5. LASSO: L1-penalized logistic regression, penalty chosen by 5-fold
+   cross-validated deviance (top 20 non-zero coefficients)
+
+A feature's consensus score is the number of methods selecting it.
+
+Methods 2-5 read the same imputed predictors: mutual information and the
+random forest their codes, the linear models (RFE, LASSO) the one-hot design
+matrix built from them by a DesignEncoder (design_matrix.py), with one
+indicator per level of the nominal codes. RFE and LASSO rank the encoded
+columns and report each variable through its best-ranked column. Both
+matrices are copied once to shared memory (shared_arrays.py) and the four
+methods run concurrently on a process pool, while the univariate survey
+tests run in the parent. Every method is
+seeded as in the notebook, so the results do not depend on the number of
+workers. The wall time of each method is returned with the results.
+
+Usage:
+    selection = run_feature_selection(data, subpops.mask('has_sex'), survey_design)
+    selection.consensus
+"""
+
+import os
+import time
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from design_matrix import DesignEncoder
+
+OUTCOME = 'early_sexual_debut'
+TOP_K = 20
+ALPHA = 0.05
+RANDOM_STATE = 42
+
+# Only variables that existed BEFORE sexual debut (no post-treatment variables)
+PREDICTOR_GROUPS = {
+    'Demographic': [
+        'v012',     # Current age (proxy for cohort)
+        'v024',     # Region/Province
+        'v025',     # Urban/rural (residence type)
+        'v102',     # Type of place of residence
+    ],
+    'Socioeconomic': [
+        'v106',     # Education level
+        'v107',     # Highest year of education
+        'v133',     # Education in single years
+        'v149',     # Educational attainment
+        'v190',     # Wealth index
+        'v191',     # Wealth index factor score
+        'v190a',    # Wealth index urban/rural
+    ],
+    'Household': [
+        'v113',     # Has electricity
+        'v115',     # Has television
+        'v116',     # Has radio
+        'v119',     # Has telephone
+        'v120',     # Has bicycle
+        'v121',     # Has motorcycle
+        'v122',     # Has car/truck
+        'v127',     # Floor material
+        'v128',     # Wall material
+        'v129',     # Roof material
+    ],
+    'Media': [
+        'v157',     # Reads newspaper
+        'v158',     # Listens to radio
+        'v159',     # Watches TV
+    ],
+    'Knowledge': [
+        'v754cp',   # Know limiting partners prevents AIDS
+        'v754dp',   # Know abstaining prevents AIDS
+    ],
+    'Cultural': [
+        'v130',     # Religion
+        'v131',     # Ethnicity
+    ],
+}
+
+METHODS = ['univariate', 'mutual_information', 'random_forest', 'rfe', 'lasso']
+
+# Methods fitted on the one-hot design matrix instead of the raw codes
+LINEAR_METHODS = ['rfe', 'lasso']
+
+# Design matrices at least this dense are fitted as dense arrays; sparse
+# products only pay off on wide, mostly-zero one-hot designs
+SPARSE_DENSITY = 0.1
+
+FeatureSelection = namedtuple('FeatureSelection',
+                              ['tables', 'selected', 'consensus', 'timings', 'X', 'y', 'encoded', 'encoder'])
+
+
+# ===== DESIGN MATRIX =====
+
+def imputed_design_matrix(data, variables, outcome=OUTCOME):
+    """
+    (X, y) for the model-based methods: rows with a known outcome, constant
+    columns dropped, missing values imputed with the most frequent value.
+    """
+    from sklearn.impute import SimpleImputer
+
+    X = data[variables]
+    y = data[outcome]
+    valid = y.notna()
+    X, y = X[valid], y[valid]
+
+    non_constant = [col for col in X.columns if X[col].nunique() > 1]
+    X = X[non_constant]
+    imputed = SimpleImputer(strategy='most_frequent').fit_transform(X)
+    return pd.DataFrame(imputed, columns=X.columns, index=X.index), y
+
+
+# ===== METHODS =====
+
+def _value_matrix(frame, variables):
+    """(float matrix with NaN for missing, numeric flags) of the variables"""
+    from survey_stats import category_codes
+
+    columns, numeric = [], []
+    for var in variables:
+        values = frame[var]
+        if pd.api.types.is_numeric_dtype(values.dtype) and not isinstance(values.dtype, pd.CategoricalDtype):
+            columns.append(values.to_numpy(dtype=float, na_value=np.nan))
+            numeric.append(True)
+        else:
+            codes = category_codes(values)[0].astype(float)
+            codes[codes < 0] = np.nan
+            columns.append(codes)
+            numeric.append(False)
+    return np.column_stack(columns), np.array(numeric)
+
+
+def distinct_counts(values):
+    """Number of distinct non-missing values in every column"""
+    ordered = np.sort(values, axis=0)  # NaNs sort last
+    present = ~np.isnan(ordered)
+    changes = (ordered[1:] != ordered[:-1]) & present[1:]
+    return present[:1].sum(axis=0) + changes.sum(axis=0)
+
+
+def two_sample_t_tests(values, groups):
+    """
+    Pooled-variance t-test (group 1 minus group 0) and Cohen's d of every column.
+
+    Missing values are skipped column by column. Returns (t, p, d) arrays.
+    """
+    from scipy.stats import t as t_distribution
+
+    moments = []
+    for group in (1, 0):
+        member = ~np.isnan(values) & (groups == group)[:, None]
+        n = member.sum(axis=0)
+        filled = np.where(member, values, 0.0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = filled.sum(axis=0) / n
+            # Second pass on deviations keeps large-valued columns (e.g. v191) accurate
+            squares = (np.where(member, values - mean, 0.0) ** 2).sum(axis=0)
+            moments.append((n, mean, squares / (n - 1)))
+    (n1, mean1, var1), (n0, mean0, var0) = moments
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        df = n1 + n0 - 2
+        pooled = ((n1 - 1) * var1 + (n0 - 1) * var0) / df
+        t_stat = (mean1 - mean0) / np.sqrt(pooled * (1 / n1 + 1 / n0))
+        p_value = 2 * t_distribution.sf(np.abs(t_stat), df)
+        pooled_std = np.sqrt((var1 + var0) / 2)
+        cohen_d = np.where(pooled_std > 0, np.abs(mean1 - mean0) / pooled_std, 0.0)
+    return t_stat, p_value, cohen_d
+
+
+def univariate_tests(data, variables, design, rows, outcome=OUTCOME, max_levels=10,
+                     min_observations=30, batch_size=256):
+    """
+    Screen every predictor against the outcome among `rows` (mask of the domain).
+
+    Variables with at most `max_levels` distinct values (and non-numeric ones)
+    get the survey-weighted Rao-Scott chi-square and Cramer's V (from the
+    weighted Pearson chi-square, not the design-corrected one), the others a
+    t-test and Cohen's d. All variables are screened together: one value
+    matrix, column-wise distinct counts and grouped moments, and Rao-Scott
+    tables from one bincount per batch of `batch_size` variables. Variables
+    with fewer than `min_observations` complete rows are skipped. Sorted by
+    p-value.
+    """
+    from survey_stats import survey_chi2_tests
+
+    rows = np.asarray(rows, dtype=bool)
+    analysis = data[rows]
+    y = analysis[outcome].to_numpy(dtype=float, na_value=np.nan)
+    values, numeric = _value_matrix(analysis, variables)
+    values[np.isnan(y)] = np.nan
+
+    n_obs = (~np.isnan(values)).sum(axis=0)
+    n_unique = distinct_counts(values)
+    tested = n_obs >= min_observations
+    categorical = tested & ((n_unique <= max_levels) | ~numeric)
+    continuous = tested & ~categorical
+
+    test_stat = np.full(len(variables), np.nan)
+    p_value = np.full(len(variables), np.nan)
+    effect_size = np.full(len(variables), np.nan)
+    pearson = np.full(len(variables), np.nan)
+
+    t_stat, t_p, cohen_d = two_sample_t_tests(values[:, continuous], y)
+    test_stat[continuous], p_value[continuous], effect_size[continuous] = t_stat, t_p, cohen_d
+
+    positions = np.flatnonzero(categorical)
+    for batch in np.array_split(positions, max(1, -(-len(positions) // batch_size))):
+        if len(batch):
+            tests, _ = survey_chi2_tests(data, [variables[i] for i in batch], outcome, design, rows)
+            test_stat[batch] = tests['chi2_rao_scott'].to_numpy()
+            p_value[batch] = tests['p_value'].to_numpy()
+            pearson[batch] = tests['chi2'].to_numpy()
+    # Cramer's V from the weighted Pearson chi-square: the Rao-Scott correction
+    # divides by the design effect, which belongs in the p-value, not the effect size
+    with np.errstate(invalid='ignore', divide='ignore'):
+        effect_size[categorical] = np.sqrt(pearson[categorical] / (
+            n_obs[categorical] * (np.minimum(n_unique[categorical], 2) - 1)))
+
+    results = pd.DataFrame({
+        'Variable': variables,
+        'Test': np.where(categorical, 'Chi-square', 't-test'),
+        'Test_Statistic': test_stat,
+        'P_value': p_value,
+        'Effect_Size': effect_size,
+        'N_observations': n_obs,
+        'Significant': np.where(p_value < ALPHA, 'Yes', 'No'),
+    })
+    return results[tested].reset_index(drop=True).sort_values('P_value')
+
+
+def level_codes(values):
+    """Dense 0-based codes of the distinct values of every column, and the number of levels"""
+    order = np.argsort(values, axis=0, kind='stable')
+    ordered = np.take_along_axis(values, order, axis=0)
+    ranks = np.zeros(values.shape, dtype=np.int64)
+    np.cumsum(ordered[1:] != ordered[:-1], axis=0, out=ranks[1:])
+    codes = np.empty_like(ranks)
+    np.put_along_axis(codes, order, ranks, axis=0)
+    return codes, ranks[-1] + 1
+
+
+def mutual_information_codes(X, max_levels=10, n_bins=10):
+    """
+    (codes, n_levels, continuous) for the plug-in estimator: columns with at
+    most `max_levels` distinct values keep their own levels, the others are
+    cut into `n_bins` equal-frequency bins (tied edges merge bins).
+    """
+    X = np.asarray(X, dtype=float)
+    codes, n_levels = level_codes(X)
+    continuous = n_levels > max_levels
+    if continuous.any():
+        edges = np.quantile(X[:, continuous], np.linspace(0, 1, n_bins + 1)[1:-1], axis=0)
+        bins = (X[:, continuous][:, None, :] > edges[None]).sum(axis=1)
+        codes[:, continuous], n_levels[continuous] = level_codes(bins)
+    return codes, n_levels, continuous
+
+
+def plugin_mutual_information(codes, n_levels, y):
+    """
+    Miller-Madow corrected plug-in MI (nats) of every coded column with y.
+
+    The contingency tables of all columns come from one bincount; each
+    entropy gains (non-empty cells - 1) / 2n, and MI is clipped at 0.
+    """
+    classes, y_codes = np.unique(y, return_inverse=True)
+    n, n_classes = len(y_codes), len(classes)
+    offsets = np.concatenate([[0], np.cumsum(n_levels)[:-1]])
+    cells = (offsets + codes) * n_classes + y_codes[:, None]
+    joint = np.bincount(cells.ravel(), minlength=n_levels.sum() * n_classes).reshape(-1, n_classes)
+    level_totals = joint.sum(axis=1)
+    class_totals = np.bincount(y_codes, minlength=n_classes)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        terms = np.where(joint > 0, joint * np.log(joint * n / np.outer(level_totals, class_totals)), 0.0)
+    mi = np.add.reduceat(terms.sum(axis=1), offsets) / n
+    # Cells absent from a subsample (codes shared with the full data) do not count
+    x_cells = np.add.reduceat(level_totals > 0, offsets)
+    joint_cells = np.add.reduceat((joint > 0).sum(axis=1), offsets)
+    mi += ((x_cells - 1) + ((class_totals > 0).sum() - 1) - (joint_cells - 1)) / (2 * n)
+    return np.maximum(mi, 0.0)
+
+
+def mutual_information(X, y, columns, max_levels=10, n_bins=10):
+    """
+    Exact plug-in MI (Miller-Madow corrected) from contingency counts:
+    discrete columns on their own levels, continuous ones (more than
+    `max_levels` values) on equal-frequency bins. Deterministic.
+    """
+    codes, n_levels, continuous = mutual_information_codes(X, max_levels, n_bins)
+    scores = plugin_mutual_information(codes, n_levels, np.asarray(y))
+    return pd.DataFrame({'Variable': columns, 'MI_Score': scores,
+                         'Estimator': np.where(continuous, 'binned', 'plug-in')}) \
+        .sort_values('MI_Score', ascending=False, kind='stable')
+
+
+def random_forest_importance(X, y, columns, random_state=RANDOM_STATE, n_jobs=-1):
+    from sklearn.ensemble import RandomForestClassifier
+
+    model = RandomForestClassifier(n_estimators=100, max_depth=10, min_samples_split=50,
+                                   random_state=random_state, class_weight='balanced',
+                                   n_jobs=n_jobs)
+    model.fit(X, y)
+    return pd.DataFrame({'Variable': columns, 'Importance': model.feature_importances_}) \
+        .sort_values('Importance', ascending=False)
+
+
+def by_variable(features, groups, order_by, ascending):
+    """
+    One row per source variable of an encoded-column table: the row of its
+    best-ranked column, which is kept in 'Feature'. The column table is
+    stored in attrs['features'].
+    """
+    table = features.rename(columns={'Variable': 'Feature'})
+    table.insert(0, 'Variable', np.asarray(groups)[table.index])
+    table = table.sort_values(order_by, ascending=ascending, kind='stable').drop_duplicates('Variable')
+    table.attrs = dict(features.attrs, features=features)
+    return table
+
+
+def rfe_ranking(X, y, columns, n_features=None, cv=5, workers=1, groups=None):
+    """
+    Warm-started RFE with the balanced logistic regression (recursive_elimination.py).
+
+    With n_features=None the count is chosen by `cv`-fold cross-validated ROC
+    AUC; the count and the fold scores are stored in table.attrs. With `groups`
+    (the variable of every column of a one-hot X), a variable is selected when
+    any of its columns is and ranks as its best column.
+    """
+    from recursive_elimination import rfe_cv
+
+    result = rfe_cv(X, y, n_features, cv=cv, workers=workers)
+    table = pd.DataFrame({'Variable': columns, 'Selected': result.support, 'Ranking': result.ranking})
+    table.attrs['n_features'] = result.n_features
+    table.attrs['cv_scores'] = result.cv_scores
+    if groups is not None:
+        return by_variable(table, groups, 'Ranking', True)
+    return table.sort_values('Ranking')
+
+
+def lasso_coefficients(X, y, columns, cv=5, workers=1, groups=None):
+    """
+    L1-penalized logistic regression on standardized features (l1_logistic_path.py).
+
+    The penalty with the lowest `cv`-fold cross-validated deviance is chosen
+    along a warm-started path; table.attrs holds it ('lambda', and sklearn's
+    equivalent 'C') and the active features at every penalty ('path'). With
+    `groups`, each variable reports its largest coefficient.
+    """
+    from recursive_elimination import standardize
+    from l1_logistic_path import l1_logistic_cv, path_table
+
+    standardized, center, _, _ = standardize(X)
+    result = l1_logistic_cv(standardized, y, cv=cv, workers=workers, center=center)
+    table = pd.DataFrame({'Variable': columns, 'Coefficient': result.coefs[result.best_index]})
+    table['Abs_Coefficient'] = abs(table['Coefficient'])
+    table.attrs['lambda'] = result.lambdas[result.best_index]
+    table.attrs['C'] = 1 / (result.n_samples * table.attrs['lambda'])
+    table.attrs['path'] = path_table(result, columns)
+    if groups is not None:
+        return by_variable(table, groups, 'Abs_Coefficient', False)
+    return table.sort_values('Abs_Coefficient', ascending=False)
+
+
+MATRIX_METHODS = {
+    'mutual_information': mutual_information,
+    'random_forest': random_forest_importance,
+    'rfe': rfe_ranking,
+    'lasso': lasso_coefficients,
+}
+
+
+def selected_features(method, table, top_k=TOP_K, alpha=ALPHA):
+    """Features a method selects, in its ranking order"""
+    if method == 'univariate':
+        table = table[table['P_value'] < alpha]
+    elif method == 'rfe':
+        table = table[table['Selected']]
+    elif method == 'mutual_information':
+        table = table[table['MI_Score'] > 0].head(top_k)
+    elif method == 'lasso':
+        table = table[table['Coefficient'] != 0].head(top_k)
+    else:
+        table = table.head(top_k)
+    return table['Variable'].tolist()
+
+
+def consensus_ranking(selected):
+    """
+    Number and share of methods selecting each feature, most selected first.
+
+    Ties keep the order in which features first appear across the methods.
+    """
+    scores = {}
+    for features in selected.values():
+        for var in features:
+            scores[var] = scores.get(var, 0) + 1
+    n_methods = len(selected)
+    consensus = pd.DataFrame([
+        {'Variable': var, 'Methods_Selected': score, 'Score_Pct': score / n_methods * 100}
+        for var, score in scores.items()
+    ], columns=['Variable', 'Methods_Selected', 'Score_Pct'])
+    return consensus.sort_values('Methods_Selected', ascending=False, kind='stable')
+
+
+# ===== PARALLEL RUN =====
+
+def encoded_matrix(encoder, X):
+    """One-hot design matrix of X: CSR when sparse enough to pay off (SPARSE_DENSITY), else dense"""
+    encoded = encoder.transform(X)
+    if encoded.nnz >= SPARSE_DENSITY * encoded.shape[0] * encoded.shape[1]:
+        return encoded.toarray()
+    return encoded
+
+
+def _timed(method, X, encoded, y, columns, encoder, params):
+    start = time.perf_counter()
+    settings = params.get(method, {})
+    if method in LINEAR_METHODS:
+        table = MATRIX_METHODS[method](encoded, y, encoder.feature_names, groups=encoder.groups, **settings)
+    else:
+        table = MATRIX_METHODS[method](X, y, columns, **settings)
+    return method, table, time.perf_counter() - start
+
+
+def _run_method(task):
+    """Worker: run one model-based method on the shared matrices"""
+    from shared_arrays import worker_arrays, shared_matrix
+
+    method, columns, encoder, params = task
+    arrays = worker_arrays()
+    return _timed(method, arrays['X'], shared_matrix(arrays, 'encoded'), arrays['y'], columns, encoder, params)
+
+
+def run_feature_selection(data, rows, design, variables=None, outcome=OUTCOME,
+                          workers=None, params=None, top_k=TOP_K, alpha=ALPHA):
+    """
+    Run the five methods and build the consensus ranking.
+
+    `rows` is the domain mask (sexually active women) within `data`, and
+    `design` the survey design of `data`. `params` ({method: kwargs}) overrides
+    method settings, e.g. {'rfe': {'n_features': 15}}. With workers=1 (or a
+    single CPU) the methods run one after another in this process.
+    """
+    params = params or {}
+    rows = np.asarray(rows, dtype=bool)
+    analysis = data[rows]
+    if variables is None:
+        variables = [var for group in PREDICTOR_GROUPS.values() for var in group]
+    variables = [var for var in variables if var in analysis.columns]
+
+    X, y = imputed_design_matrix(analysis, variables, outcome)
+    columns = list(X.columns)
+    X_values = X.to_numpy(dtype=float)
+    y_values = y.to_numpy(dtype=float)
+    encoder = DesignEncoder().fit(X)
+    encoded = encoded_matrix(encoder, X)
+
+    workers = workers or os.cpu_count() or 1
+    tables, timings = {}, {}
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        from shared_arrays import SharedArrays, attach_worker, matrix_arrays
+
+        with SharedArrays({'X': X_values, **matrix_arrays('encoded', encoded), 'y': y_values}) as shared:
+            with ProcessPoolExecutor(max_workers=min(workers, len(MATRIX_METHODS)),
+                                     initializer=attach_worker,
+                                     initargs=(shared.descriptors,)) as pool:
+                futures = [pool.submit(_run_method, (method, columns, encoder, params))
+                           for method in MATRIX_METHODS]
+                start = time.perf_counter()
+                tables['univariate'] = univariate_tests(data, variables, design, rows, outcome)
+                timings['univariate'] = time.perf_counter() - start
+                for future in futures:
+                    method, table, seconds = future.result()
+                    tables[method], timings[method] = table, seconds
+    else:
+        start = time.perf_counter()
+        tables['univariate'] = univariate_tests(data, variables, design, rows, outcome)
+        timings['univariate'] = time.perf_counter() - start
+        for method in MATRIX_METHODS:
+            _, tables[method], timings[method] = _timed(method, X_values, encoded, y_values, columns,
+                                                        encoder, params)
+
+    tables = {method: tables[method] for method in METHODS}
+    selected = {method: selected_features(method, table, top_k, alpha)
+                for method, table in tables.items()}
+    return FeatureSelection(tables, selected, consensus_ranking(selected),
+                            {method: timings[method] for method in METHODS}, X, y, encoded, encoder)
@@ -0,0 +1,86 @@
+"""
+MULTICOLLINEARITY DIAGNOSTICS
+=============================
+
+Correlation matrix, highly correlated pairs and variance inflation factors
+for any number of predictors:
+
+- VIF_j = [R^-1]_jj, the j-th diagonal element of the inverse correlation
+  matrix. This equals 1 / (1 - R^2_j) from regressing predictor j on all the
+  others with an intercept, so every VIF comes from one Cholesky
+  factorization instead of one OLS fit per variable.
+- When R is singular (duplicated or perfectly collinear predictors), the
+  predictors involved in an exact linear dependence get an infinite VIF and
+  the others are read off the pseudo-inverse. With ridge > 0, (R + ridge I)^-1
+  is used instead, which keeps every VIF finite.
+- Highly correlated pairs come from one vectorized threshold over the upper
+  triangle of R.
+
+Constant columns have no correlation and must be removed beforehand.
+
+Usage:
+    corr = correlation_matrix(X)
+    pairs = correlated_pairs(corr, threshold=0.8)
+    vif = variance_inflation_factors(corr)
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def correlation_matrix(X):
+    """Pearson correlation matrix (DataFrame) of the columns of a complete DataFrame"""
+    values = X.to_numpy(dtype=float)
+    return pd.DataFrame(np.corrcoef(values, rowvar=False), index=X.columns, columns=X.columns)
+
+
+def correlated_pairs(corr, threshold=0.8):
+    """Pairs with |r| > threshold, in row-major upper-triangle order"""
+    values = corr.to_numpy()
+    rows, cols = np.triu_indices(len(values), k=1)
+    strong = np.abs(values[rows, cols]) > threshold
+    rows, cols = rows[strong], cols[strong]
+    return pd.DataFrame({'Var1': corr.columns[rows], 'Var2': corr.columns[cols],
+                         'Correlation': values[rows, cols]})
+
+
+def inverse_diagonal(corr, ridge=0.0, tol=None, max_vif=1e10):
+    """
+    Diagonal of the inverse of a correlation matrix (array).
+
+    Uses a Cholesky factor R = L L' (diag(R^-1) = column sums of (L^-1)^2).
+    If R is not positive definite, or a VIF exceeds `max_vif`, falls back to
+    the eigendecomposition: predictors with a loading on a (near-)null
+    eigenvector get inf, the others come from the pseudo-inverse.
+    """
+    from scipy.linalg import lapack
+
+    values = np.asarray(corr, dtype=float)
+    if ridge > 0:
+        values = values + ridge * np.eye(len(values))
+    try:
+        inverse_factor, info = lapack.dtrtri(np.linalg.cholesky(values), lower=1)
+        if info == 0:
+            diagonal = (inverse_factor ** 2).sum(axis=0)
+            if diagonal.max() < max_vif:
+                return diagonal
+    except np.linalg.LinAlgError:
+        pass
+
+    eigenvalues, vectors = np.linalg.eigh(values)
+    tol = len(values) * np.finfo(float).eps * eigenvalues.max() if tol is None else tol
+    kept = eigenvalues > tol
+
+    diagonal = (vectors[:, kept] ** 2 / eigenvalues[kept]).sum(axis=1)
+    if not kept.all():
+        # Loadings below this are rounding noise, not membership in the dependence
+        involved = (vectors[:, ~kept] ** 2).sum(axis=1) > np.sqrt(np.finfo(float).eps)
+        diagonal[involved] = np.inf
+    return diagonal
+
+
+def variance_inflation_factors(corr, ridge=0.0):
+    """VIF of every predictor from its correlation matrix, highest first"""
+    vif = inverse_diagonal(corr, ridge)
+    return pd.DataFrame({'Variable': corr.columns, 'VIF': vif}) \
+        .sort_values('VIF', ascending=False, kind='stable')
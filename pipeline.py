@@ -0,0 +1,309 @@
+"""
+CONTENT-ADDRESSED PIPELINE RUNNER
+=================================
+
+Runs the analysis workflow as a DAG of stages. Each stage declares the files
+it reads and writes; the local modules a script imports are added to its
+inputs automatically, so editing e.g. consistency_rules.py re-runs every
+stage that uses it.
+
+A stage is skipped when the hash of its command and inputs matches the last
+successful run recorded in `.dhs_cache/pipeline_state.json` and its outputs
+are still the files that run produced. Stages whose inputs do not depend on
+each other (data dictionary, consistency checks, cleaning) run concurrently;
+their console output goes to `.dhs_cache/logs/<stage>.log`.
+
+    data_dictionary ─┐
+    consistency ─────┤
+    cleaning ────────┴─> eda
+                     └─> feature_selection
+
+The model comparison step that follows feature selection is not part of this
+repository (only its figures and model_summary*.csv are), so it has no stage.
+
+Usage:
+    python pipeline.py                      (run everything that is out of date)
+    python pipeline.py eda                  (eda and the stages it depends on)
+    python pipeline.py --dry-run
+    python pipeline.py --force cleaning
+"""
+
+import os
+import re
+import sys
+import ast
+import json
+import time
+import hashlib
+import argparse
+import subprocess
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from data_loader import CACHE_DIR
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STATE_FILE = os.path.join(ROOT, CACHE_DIR, 'pipeline_state.json')
+LOG_DIR = os.path.join(ROOT, CACHE_DIR, 'logs')
+
+Stage = namedtuple('Stage', ['name', 'command', 'inputs', 'outputs'])
+
+DATASET = 'rwanda_early_sexual_debut_dataset.csv'
+CLEANED = 'rwanda_dhs_CLEANED_minimal.csv'
+NOTEBOOK = 'feacture_selection.ipynb'
+
+STAGES = [
+    Stage('data_dictionary', [sys.executable, 'data_dictionary_analysis.py'],
+          ['data_dictionary_analysis.py'],
+          ['rwanda_dhs_data_dictionary.csv']),
+    Stage('consistency', [sys.executable, 'check_data_consistency.py'],
+          ['check_data_consistency.py', DATASET],
+          ['data_inconsistencies_flagged.csv']),
+    Stage('cleaning', [sys.executable, 'cleaning_impossibl_case.py'],
+          ['cleaning_impossibl_case.py', DATASET],
+          [CLEANED, 'excluded_impossible_cases.csv']),
+    Stage('eda', [sys.executable, 'EDA_Analysis.py'],
+          ['EDA_Analysis.py', CLEANED],
+          ['Table1_Descriptive_Statistics.csv']),
+    Stage('feature_selection',
+          [sys.executable, '-m', 'jupyter', 'nbconvert', '--to', 'notebook', '--execute',
+           NOTEBOOK, '--output-dir', os.path.join(CACHE_DIR, 'executed')],
+          [NOTEBOOK, CLEANED],
+          ['Feature_Selection_Univariate_Tests.csv', 'Feature_Selection_Consensus_Ranking.csv',
+           'Final_Selected_Features_for_Modeling.csv', 'Feature_Selection_Final_Summary.txt']),
+]
+
+STAGES_BY_NAME = {stage.name: stage for stage in STAGES}
+
+# IPython magics and shell escapes are not Python syntax
+MAGIC_LINE = re.compile(r'^\s*[%!]', re.MULTILINE)
+
+
+# ===== INPUT DISCOVERY =====
+
+def _source_of(path):
+    """Python source of a script or of the code cells of a notebook"""
+    with open(path, encoding='utf-8') as f:
+        if path.endswith('.ipynb'):
+            cells = json.load(f)['cells']
+            source = '\n'.join(''.join(cell['source']) for cell in cells
+                               if cell['cell_type'] == 'code')
+        else:
+            source = f.read()
+    return MAGIC_LINE.sub('pass  #', source)
+
+
+def local_imports(path, seen=None):
+    """Repository modules imported by a script or notebook, recursively"""
+    seen = set() if seen is None else seen
+    try:
+        tree = ast.parse(_source_of(os.path.join(ROOT, path)))
+    except (SyntaxError, OSError):
+        return seen
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            names = [node.module]
+        else:
+            continue
+        for name in names:
+            module = name.split('.')[0] + '.py'
+            if module not in seen and os.path.exists(os.path.join(ROOT, module)):
+                seen.add(module)
+                local_imports(module, seen)
+    return seen
+
+
+def stage_inputs(stage):
+    """Declared inputs plus the local modules the stage's code imports"""
+    inputs = set(stage.inputs)
+    for path in stage.inputs:
+        if path.endswith(('.py', '.ipynb')):
+            inputs |= local_imports(path)
+    return sorted(inputs)
+
+
+def dependencies(stages=STAGES):
+    """{stage: set of stages producing one of its inputs}"""
+    producers = {output: stage.name for stage in stages for output in stage.outputs}
+    return {stage.name: {producers[path] for path in stage.inputs
+                         if path in producers and producers[path] != stage.name}
+            for stage in stages}
+
+
+# ===== HASHING AND STATE =====
+
+class FileHasher:
+    """sha256 of files, reusing earlier hashes while size and mtime are unchanged"""
+
+    def __init__(self, known=None):
+        self.known = dict(known or {})
+
+    def __call__(self, path):
+        full_path = os.path.join(ROOT, path)
+        if not os.path.exists(full_path):
+            return None
+        stat = os.stat(full_path)
+        stamp = [stat.st_size, stat.st_mtime_ns]
+        cached = self.known.get(path)
+        if cached and cached[:2] == stamp:
+            return cached[2]
+        digest = hashlib.sha256()
+        with open(full_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        self.known[path] = stamp + [digest.hexdigest()]
+        return digest.hexdigest()
+
+
+def stage_key(stage, hasher):
+    """Content address of a stage: its command and the hash of every input"""
+    payload = {'command': stage.command[1:] if stage.command[0] == sys.executable else stage.command,
+               'inputs': {path: hasher(path) for path in stage_inputs(stage)}}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def load_state():
+    try:
+        with open(STATE_FILE, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'stages': {}, 'files': {}}
+
+
+def save_state(state):
+    os.makedirs(os.path.dirname(STATE_FILE), exist_ok=True)
+    tmp_file = STATE_FILE + f'.tmp{os.getpid()}'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp_file, STATE_FILE)
+
+
+def is_up_to_date(stage, key, state, hasher):
+    """Same inputs as the last successful run, and its outputs are untouched"""
+    previous = state['stages'].get(stage.name)
+    if previous is None or previous['key'] != key:
+        return False
+    return all(hasher(path) == digest for path, digest in previous['outputs'].items())
+
+
+# ===== EXECUTION =====
+
+def run_stage(stage):
+    """Run one stage, logging its console output; returns (returncode, seconds)"""
+    os.makedirs(LOG_DIR, exist_ok=True)
+    start = time.perf_counter()
+    with open(os.path.join(LOG_DIR, stage.name + '.log'), 'w', encoding='utf-8') as log:
+        process = subprocess.run(stage.command, cwd=ROOT, stdout=log, stderr=subprocess.STDOUT,
+                                 env=dict(os.environ, PYTHONIOENCODING='utf-8'))
+    return process.returncode, time.perf_counter() - start
+
+
+def with_upstream(targets, deps):
+    """Targets and every stage they depend on"""
+    selected, pending = set(), list(targets)
+    while pending:
+        name = pending.pop()
+        if name not in selected:
+            selected.add(name)
+            pending.extend(deps[name])
+    return selected
+
+
+def run_pipeline(targets=None, workers=None, force=(), dry_run=False):
+    """Run out-of-date stages in dependency order, independent ones concurrently"""
+    deps = dependencies()
+    selected = with_upstream(targets or STAGES_BY_NAME, deps)
+    state = load_state()
+    hasher = FileHasher(state.get('files'))
+    force = set(force)
+
+    done, failed, started, running = set(), set(), set(), {}
+    statuses = {}
+    with ThreadPoolExecutor(max_workers=workers or len(STAGES)) as pool:
+        while True:
+            # Schedule every stage whose upstream stages have all finished
+            for name in [stage.name for stage in STAGES]:
+                if name not in selected or name in done | failed or name in started:
+                    continue
+                if deps[name] & failed:
+                    failed.add(name)
+                    statuses[name] = 'blocked'
+                    print(f"  ✗ {name:20s} blocked by a failed upstream stage")
+                    continue
+                if not (deps[name] & selected) <= done:
+                    continue
+                stage = STAGES_BY_NAME[name]
+                key = stage_key(stage, hasher)
+                upstream_pending = dry_run and any(statuses.get(dep) == 'would run' for dep in deps[name])
+                if name not in force and not upstream_pending and is_up_to_date(stage, key, state, hasher):
+                    done.add(name)
+                    statuses[name] = 'skipped'
+                    print(f"  • {name:20s} up to date")
+                elif dry_run:
+                    done.add(name)
+                    statuses[name] = 'would run'
+                    print(f"  ▶ {name:20s} would run")
+                else:
+                    print(f"  ▶ {name:20s} started")
+                    started.add(name)
+                    running[pool.submit(run_stage, stage)] = (name, key)
+                    state['stages'].pop(name, None)
+
+            if not running:
+                break
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name, key = running.pop(future)
+                stage = STAGES_BY_NAME[name]
+                returncode, seconds = future.result()
+                log_file = os.path.relpath(os.path.join(LOG_DIR, name + '.log'), ROOT)
+                missing = [path for path in stage.outputs if hasher(path) is None]
+                if returncode != 0 or missing:
+                    failed.add(name)
+                    statuses[name] = 'failed'
+                    reason = f"exit code {returncode}" if returncode else f"missing {', '.join(missing)}"
+                    print(f"  ✗ {name:20s} failed ({reason}, {seconds:.1f}s) - see {log_file}")
+                    continue
+                # Recorded under the key of the inputs the stage was started with
+                state['stages'][name] = {
+                    'key': key,
+                    'outputs': {path: hasher(path) for path in stage.outputs},
+                    'seconds': round(seconds, 2),
+                }
+                done.add(name)
+                statuses[name] = 'ran'
+                print(f"  ✓ {name:20s} finished in {seconds:.1f}s")
+
+    if not dry_run:
+        state['files'] = hasher.known
+        save_state(state)
+    return statuses
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run the analysis pipeline, skipping unchanged stages')
+    parser.add_argument('targets', nargs='*',
+                        help=f"Stages to bring up to date (default: all): {', '.join(STAGES_BY_NAME)}")
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Maximum number of stages running at once')
+    parser.add_argument('--force', nargs='*', default=[], choices=list(STAGES_BY_NAME),
+                        help='Re-run these stages even if up to date')
+    parser.add_argument('--dry-run', action='store_true', help='Only show what would run')
+    args = parser.parse_args()
+    unknown = set(args.targets) - set(STAGES_BY_NAME)
+    if unknown:
+        parser.error(f"unknown stage(s): {', '.join(sorted(unknown))}")
+
+    print("="*80)
+    print("ANALYSIS PIPELINE")
+    print("="*80 + "\n")
+
+    statuses = run_pipeline(args.targets, args.workers, args.force, args.dry_run)
+
+    print("\nSummary:")
+    for name, status in statuses.items():
+        print(f"  {name:20s}: {status}")
+    sys.exit(1 if 'failed' in statuses.values() or 'blocked' in statuses.values() else 0)
@@ -0,0 +1,99 @@
+"""
+SHARED-MEMORY NUMPY ARRAYS FOR WORKER PROCESSES
+===============================================
+
+Small helper used by the parallel stages to hand columns of the dataset to
+a process pool without pickling DataFrames. The parent copies each array
+once into a `multiprocessing.shared_memory` block; workers attach to the
+blocks by name and get zero-copy numpy views.
+
+Usage:
+    with SharedArrays({'v525': v525, 'v531': v531}) as shared:
+        with ProcessPoolExecutor(initializer=attach_worker,
+                                 initargs=(shared.descriptors,)) as pool:
+            ...
+    # inside a worker: arrays = worker_arrays()
+
+Sparse CSR matrices travel as their component arrays (matrix_arrays /
+shared_matrix).
+"""
+
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Arrays attached in the current worker process (filled by attach_worker)
+_WORKER_ARRAYS = {}
+_WORKER_BLOCKS = []
+
+
+class SharedArrays:
+    """Copy a dict of numpy arrays into shared memory blocks owned by this process"""
+
+    def __init__(self, arrays):
+        self.blocks = []
+        self.descriptors = {}
+        for name, values in arrays.items():
+            values = np.ascontiguousarray(values)
+            block = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+            np.ndarray(values.shape, dtype=values.dtype, buffer=block.buf)[...] = values
+            self.blocks.append(block)
+            self.descriptors[name] = (block.name, values.dtype.str, values.shape)
+
+    def close(self):
+        """Release and remove every block"""
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        self.blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def attach(descriptors):
+    """Attach to shared blocks and return ({name: array}, blocks)"""
+    arrays, blocks = {}, []
+    for name, (block_name, dtype, shape) in descriptors.items():
+        # Pool workers share the parent's resource tracker, so attaching here
+        # does not add a second owner; the parent unlinks the block
+        block = shared_memory.SharedMemory(name=block_name)
+        arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+        blocks.append(block)
+    return arrays, blocks
+
+
+def attach_worker(descriptors):
+    """Process-pool initializer: attach the shared arrays once per worker"""
+    arrays, blocks = attach(descriptors)
+    _WORKER_ARRAYS.update(arrays)
+    _WORKER_BLOCKS.extend(blocks)
+
+
+def worker_arrays():
+    """Arrays attached by attach_worker in this process"""
+    return _WORKER_ARRAYS
+
+
+def matrix_arrays(name, matrix):
+    """Arrays for SharedArrays holding a dense array or a CSR matrix (as its components)"""
+    from scipy import sparse
+
+    if not sparse.issparse(matrix):
+        return {name: matrix}
+    return {f'{name}_data': matrix.data, f'{name}_indices': matrix.indices,
+            f'{name}_indptr': matrix.indptr, f'{name}_shape': np.array(matrix.shape)}
+
+
+def shared_matrix(arrays, name):
+    """The matrix stored by matrix_arrays: the array itself or a CSR view over the components"""
+    from scipy import sparse
+
+    if name in arrays:
+        return arrays[name]
+    shape = tuple(int(size) for size in arrays[f'{name}_shape'])
+    return sparse.csr_matrix((arrays[f'{name}_data'], arrays[f'{name}_indices'], arrays[f'{name}_indptr']),
+                             shape=shape, copy=False)
@@ -0,0 +1,154 @@
+"""
+STABILITY SELECTION FOR THE CONSENSUS RANKING
+=============================================
+
+Repeats the model-based selectors of feature_selection.py (mutual
+information, random forest, RFE and L1 logistic regression) on many
+subsamples and reports how often each feature is selected:
+
+- subsamples are complementary pairs of stratified half-samples (each pair
+  splits every outcome class in two disjoint halves), as in Shah & Samworth's
+  variant of Meinshausen & Buhlmann's stability selection
+- each selector keeps its full-data definition (top 20 with MI > 0, top
+  20, RFE selection, top 20 non-zero L1 coefficients) and its full-data
+  tuning: the RFE feature count and the L1 penalty chosen by
+  cross-validation are reused, so no subsample runs a cross-validation, and
+  the L1 fits reuse the full-data standardization and penalty grid
+- RFE and L1 run on the full-data one-hot design matrix and its encoding
+  (design_matrix.py), rows selected per subsample
+- mutual information reuses the full-data level codes (and continuous
+  bins), so each subsample only recounts its contingency tables
+- the matrices are copied once to shared memory and the subsamples run
+  on a process pool; each subsample is seeded as the full-data run, so the
+  frequencies do not depend on the number of workers
+
+The survey-weighted univariate tests do not carry over to subsamples; they
+contribute their full-data vote (0 or 1). A feature's stability is its mean
+selection probability over the five methods, which reduces to
+Methods_Selected / 5 when every method votes 0 or 1.
+
+Usage:
+    selection = run_feature_selection(data, subpops.mask('has_sex'), survey_design)
+    stability = stability_selection(selection, n_subsamples=100)
+    stability.consensus
+"""
+
+import os
+import time
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from feature_selection import (METHODS, TOP_K, RANDOM_STATE, MATRIX_METHODS, by_variable,
+                               mutual_information_codes, plugin_mutual_information,
+                               random_forest_importance, rfe_ranking, selected_features)
+
+N_SUBSAMPLES = 100
+
+StabilitySelection = namedtuple('StabilitySelection', ['frequencies', 'consensus', 'n_subsamples', 'seconds'])
+
+
+def complementary_halves(y, n_pairs, random_state=RANDOM_STATE):
+    """2 * n_pairs sorted row-index arrays: disjoint stratified halves, pair by pair"""
+    rng = np.random.default_rng(random_state)
+    classes = [np.flatnonzero(y == value) for value in np.unique(y)]
+    subsamples = []
+    for _ in range(n_pairs):
+        halves = ([], [])
+        for members in classes:
+            shuffled = rng.permutation(members)
+            halves[0].append(shuffled[:len(shuffled) // 2])
+            halves[1].append(shuffled[len(shuffled) // 2:])
+        subsamples += [np.sort(np.concatenate(half)) for half in halves]
+    return subsamples
+
+
+def _l1_coefficients(X_std, center, y, features, groups, lambdas):
+    """Per-variable coefficient table at the last penalty of `lambdas`, fitted along the warm-started path"""
+    from l1_logistic_path import l1_logistic_path
+
+    coefs, _ = l1_logistic_path(X_std, y, lambdas, center=center)
+    table = pd.DataFrame({'Variable': features, 'Coefficient': coefs[-1]})
+    table['Abs_Coefficient'] = abs(table['Coefficient'])
+    return by_variable(table, groups, 'Abs_Coefficient', False)
+
+
+def _mi_table(codes, n_levels, y, columns):
+    scores = plugin_mutual_information(codes, n_levels, y)
+    return pd.DataFrame({'Variable': columns, 'MI_Score': scores}) \
+        .sort_values('MI_Score', ascending=False, kind='stable')
+
+
+def subsample_selection(X, codes, encoded, X_std, y, rows, settings):
+    """Boolean (methods x features) matrix of the features each method selects on `rows`"""
+    columns, n_levels, features, groups, center, n_features, lambdas, top_k = settings
+    y_sub = y[rows]
+    tables = {
+        'mutual_information': _mi_table(codes[rows], n_levels, y_sub, columns),
+        'random_forest': random_forest_importance(X[rows], y_sub, columns, n_jobs=1),
+        'rfe': rfe_ranking(encoded[rows], y_sub, features, n_features=n_features, groups=groups),
+        'lasso': _l1_coefficients(X_std[rows], center, y_sub, features, groups, lambdas),
+    }
+    return np.array([np.isin(columns, selected_features(method, tables[method], top_k))
+                     for method in MATRIX_METHODS])
+
+
+def _run_subsample(task):
+    """Worker: one subsample on the shared design matrix"""
+    from shared_arrays import worker_arrays, shared_matrix
+
+    rows, settings = task
+    arrays = worker_arrays()
+    return subsample_selection(arrays['X'], arrays['codes'], shared_matrix(arrays, 'encoded'),
+                               shared_matrix(arrays, 'X_std'), arrays['y'], rows, settings)
+
+
+def stability_selection(selection, n_subsamples=N_SUBSAMPLES, workers=None, top_k=TOP_K,
+                        random_state=RANDOM_STATE):
+    """
+    Selection frequencies of every method over `n_subsamples` half-samples
+    (rounded up to complementary pairs) of a run_feature_selection result.
+
+    `frequencies` has one row per feature and one column per method;
+    `consensus` adds the Stability score, most stable first.
+    """
+    from recursive_elimination import standardize
+
+    start = time.perf_counter()
+    columns = list(selection.X.columns)
+    X = selection.X.to_numpy(dtype=float)
+    y = selection.y.to_numpy(dtype=float)
+    codes, n_levels, _ = mutual_information_codes(X)
+    X_std, center, _, _ = standardize(selection.encoded)
+
+    lasso = selection.tables['lasso'].attrs['path']
+    lambdas = lasso['lambda'].to_numpy()
+    lambdas = lambdas[:np.flatnonzero(lambdas == selection.tables['lasso'].attrs['lambda'])[0] + 1]
+    settings = (np.array(columns), n_levels, selection.encoder.feature_names, selection.encoder.groups,
+                center, selection.tables['rfe'].attrs['n_features'], lambdas, top_k)
+    subsamples = complementary_halves(y, (n_subsamples + 1) // 2, random_state)
+
+    workers = workers or os.cpu_count() or 1
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        from shared_arrays import SharedArrays, attach_worker, matrix_arrays
+
+        shared_inputs = {'X': X, 'codes': codes, **matrix_arrays('encoded', selection.encoded),
+                         **matrix_arrays('X_std', X_std), 'y': y}
+        with SharedArrays(shared_inputs) as shared:
+            with ProcessPoolExecutor(max_workers=workers, initializer=attach_worker,
+                                     initargs=(shared.descriptors,)) as pool:
+                votes = list(pool.map(_run_subsample, [(rows, settings) for rows in subsamples],
+                                      chunksize=max(1, len(subsamples) // (4 * workers))))
+    else:
+        votes = [subsample_selection(X, codes, selection.encoded, X_std, y, rows, settings)
+                 for rows in subsamples]
+
+    frequencies = pd.DataFrame(np.mean(votes, axis=0).T, columns=list(MATRIX_METHODS))
+    frequencies.insert(0, 'univariate', np.isin(columns, selection.selected['univariate']).astype(float))
+    frequencies.insert(0, 'Variable', columns)
+    consensus = frequencies[['Variable'] + METHODS].copy()
+    consensus['Stability'] = consensus[METHODS].mean(axis=1)
+    consensus = consensus.sort_values('Stability', ascending=False, kind='stable')
+    return StabilitySelection(frequencies, consensus, len(subsamples), time.perf_counter() - start)
@@ -0,0 +1,132 @@
+"""
+SHARED ANALYTIC SUBPOPULATIONS
+==============================
+
+The validity masks every stage conditions on (sexually active women, mothers,
+women with both ages reported) are defined once here. A `Subpopulations`
+registry computes them lazily for one dataset and caches them as packed
+bitmaps next to the dataset cache (`.dhs_cache/<csv>.subpopulations.npz`),
+keyed on the source file fingerprint. Callers get read-only boolean masks or
+row indices instead of filtered copies of the frame.
+
+consistency_rules.MASKS reuses the same definitions.
+
+Usage:
+    subpops = Subpopulations(data, 'rwanda_dhs_CLEANED_minimal.csv')
+    has_sex = subpops.mask('has_sex')
+    data.loc[has_sex, 'early_sexual_debut'].mean()
+    mothers = subpops.take('has_birth', ['v531', 'early_first_birth'])
+"""
+
+import os
+import json
+import hashlib
+from collections import namedtuple
+
+import numpy as np
+
+from data_loader import cache_path_for, source_fingerprint
+
+CACHE_SUFFIX = '.subpopulations.npz'
+
+Subpopulation = namedtuple('Subpopulation', ['name', 'label', 'expression', 'columns'])
+
+
+def valid_age(values):
+    """Valid reported age (1-49); NaN compares False"""
+    return (values > 0) & (values < 50)
+
+
+# Expressions read columns and other subpopulations as attributes of the
+# context they are given (a Subpopulations registry or a MaskContext)
+SUBPOPULATIONS = [
+    Subpopulation('has_sex', 'Sexually active (valid age at first sex)',
+                  lambda m: valid_age(m.v525), ['v525']),
+    Subpopulation('has_birth', 'Gave birth (valid age at first birth)',
+                  lambda m: valid_age(m.v531), ['v531']),
+    Subpopulation('has_both', 'Valid ages at first sex and first birth',
+                  lambda m: m.has_sex & m.has_birth, ['v525', 'v531']),
+]
+
+SUBPOPULATIONS_BY_NAME = {subpop.name: subpop for subpop in SUBPOPULATIONS}
+
+
+def definitions_signature():
+    """Identify the subpopulation definitions a bitmap cache was built with"""
+    with open(__file__, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+class Subpopulations:
+    """Lazily computed, cached subpopulation masks of one dataset"""
+
+    def __init__(self, data, csv_path=None, use_cache=True):
+        self.data = data
+        self.cache_file = cache_path_for(csv_path, CACHE_SUFFIX) if csv_path and use_cache else None
+        self._fingerprint = None
+        self._columns = {}
+        self._masks = {}
+        self._rows = {}
+        if self.cache_file:
+            self._fingerprint = json.dumps({'source': source_fingerprint(csv_path),
+                                            'definitions': definitions_signature(),
+                                            'rows': len(data)}, sort_keys=True)
+            self._load_cache()
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        if name in SUBPOPULATIONS_BY_NAME:
+            return self.mask(name)
+        if name not in self._columns:
+            self._columns[name] = self.data[name].to_numpy(dtype=float, na_value=np.nan)
+        return self._columns[name]
+
+    def _load_cache(self):
+        if not os.path.exists(self.cache_file):
+            return
+        try:
+            with np.load(self.cache_file) as cached:
+                if str(cached['fingerprint']) != self._fingerprint:
+                    return
+                for name in cached.files:
+                    if name in SUBPOPULATIONS_BY_NAME:
+                        self._masks[name] = self._freeze(
+                            np.unpackbits(cached[name], count=len(self.data)).astype(bool))
+        except Exception:
+            self._masks = {}
+
+    def _save_cache(self):
+        packed = {name: np.packbits(mask) for name, mask in self._masks.items()}
+        os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+        tmp_file = self.cache_file + f'.tmp{os.getpid()}.npz'
+        np.savez(tmp_file, fingerprint=np.array(self._fingerprint), **packed)
+        os.replace(tmp_file, self.cache_file)
+
+    @staticmethod
+    def _freeze(values):
+        values.flags.writeable = False
+        return values
+
+    def mask(self, name):
+        """Read-only boolean mask of the rows in a subpopulation"""
+        if name not in self._masks:
+            expression = SUBPOPULATIONS_BY_NAME[name].expression
+            self._masks[name] = self._freeze(np.asarray(expression(self), dtype=bool))
+            if self.cache_file:
+                self._save_cache()
+        return self._masks[name]
+
+    def rows(self, name):
+        """Positional row indices of a subpopulation"""
+        if name not in self._rows:
+            self._rows[name] = self._freeze(np.flatnonzero(self.mask(name)))
+        return self._rows[name]
+
+    def count(self, name):
+        return len(self.rows(name))
+
+    def take(self, name, columns=None):
+        """Subpopulation rows of the dataset (only `columns`, if given)"""
+        data = self.data if columns is None else self.data[columns]
+        return data.iloc[self.rows(name)]
@@ -0,0 +1,190 @@
+"""
+SURVEY-WEIGHTED CROSSTABS AND RAO-SCOTT CHI-SQUARE
+==================================================
+
+DHS is a stratified two-stage cluster sample, so bivariate tests must use the
+normalized weights (sample_weight = v005 / 1,000,000) and account for the
+design. This module provides:
+
+1. Weighted contingency tables accumulated with `np.bincount` over integer
+   category codes (no pandas groupby / crosstab)
+2. The first-order Rao-Scott corrected chi-square test of independence:
+   the Pearson statistic of the weighted proportions divided by the mean
+   generalized design effect, whose cell and margin variances come from
+   Taylor linearization over PSUs (v001) within strata (v022)
+3. `survey_chi2_tests`, which tests many variables against one outcome with a
+   single bincount over all of their cells at once
+
+Strata with a single PSU contribute no variance. Without cluster information
+every respondent is treated as her own PSU.
+
+Usage:
+    design = SurveyDesign.from_data(data)
+    results = survey_chi2_tests(data, ['education_category', 'residence'],
+                                'early_sexual_debut', design)
+"""
+
+import numpy as np
+import pandas as pd
+from scipy.stats import chi2 as chi2_distribution
+
+WEIGHT_COLUMN = 'sample_weight'
+CLUSTER_COLUMN = 'v001'
+STRATA_COLUMN = 'v022'
+
+TEST_COLUMNS = ['variable', 'n', 'df', 'chi2', 'design_effect', 'chi2_rao_scott', 'p_value']
+
+
+class SurveyDesign:
+    """Weights and PSU / stratum indices of the respondents of a survey"""
+
+    def __init__(self, weights, clusters=None, strata=None):
+        self.weights = np.asarray(weights, dtype=float)
+        n_rows = len(self.weights)
+        strata = np.zeros(n_rows) if strata is None else np.asarray(strata)
+        clusters = np.arange(n_rows) if clusters is None else np.asarray(clusters)
+
+        # PSUs are numbered within strata, so equal cluster ids in two strata stay apart
+        psu_keys = pd.MultiIndex.from_arrays([strata, clusters])
+        self.psu, psu_index = pd.factorize(psu_keys)
+        self.n_psu = len(psu_index)
+        self.psu_stratum, stratum_index = pd.factorize(psu_index.get_level_values(0))
+        self.n_strata = len(stratum_index)
+
+        # n_h / (n_h - 1) per stratum; single-PSU strata get 0
+        psu_per_stratum = np.bincount(self.psu_stratum, minlength=self.n_strata)
+        with np.errstate(divide='ignore'):
+            self.stratum_factor = np.where(psu_per_stratum > 1,
+                                           psu_per_stratum / (psu_per_stratum - 1), 0.0)
+
+    @classmethod
+    def from_data(cls, data, weight=WEIGHT_COLUMN, cluster=CLUSTER_COLUMN, strata=STRATA_COLUMN):
+        """Design of a DHS extract; cluster / strata columns are used when present"""
+        weights = data[weight].to_numpy(dtype=float, na_value=0.0)
+        clusters = data[cluster].to_numpy() if cluster in data.columns else None
+        strata_values = data[strata].to_numpy() if strata in data.columns else None
+        return cls(weights, clusters, strata_values)
+
+    def subset(self, rows):
+        """Design of a subset of respondents (mask or positions); PSU structure is kept"""
+        design = object.__new__(SurveyDesign)
+        design.__dict__.update(self.__dict__)
+        design.weights = self.weights[rows]
+        design.psu = self.psu[rows]
+        return design
+
+    def linearized_variance(self, psu_totals):
+        """Between-PSU variance within strata of per-PSU totals (n_psu x k)"""
+        stratum_sums = np.zeros((self.n_strata, psu_totals.shape[1]))
+        np.add.at(stratum_sums, self.psu_stratum, psu_totals)
+        psu_per_stratum = np.bincount(self.psu_stratum, minlength=self.n_strata)
+        stratum_means = stratum_sums / np.maximum(psu_per_stratum, 1)[:, None]
+        deviations = (psu_totals - stratum_means[self.psu_stratum]) ** 2
+        squared = np.zeros_like(stratum_sums)
+        np.add.at(squared, self.psu_stratum, deviations)
+        return (self.stratum_factor[:, None] * squared).sum(axis=0)
+
+
+def category_codes(values):
+    """(integer codes, levels) of a column; missing values get -1"""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.codes.to_numpy().astype(np.intp), list(values.cat.categories)
+    codes, levels = pd.factorize(values, sort=True)
+    return codes.astype(np.intp), list(levels)
+
+
+def weighted_crosstab(row_codes, col_codes, weights, n_row, n_col):
+    """Weighted (n_row x n_col) table of two integer code arrays (-1 codes are skipped)"""
+    valid = (row_codes >= 0) & (col_codes >= 0)
+    cells = row_codes[valid] * n_col + col_codes[valid]
+    return np.bincount(cells, weights=weights[valid], minlength=n_row * n_col).reshape(n_row, n_col)
+
+
+def rao_scott_from_totals(psu_totals, n_obs, design):
+    """
+    First-order Rao-Scott test from weighted per-PSU cell totals (n_psu x R x C).
+
+    Returns (pearson chi2, mean design effect, corrected chi2, df, p-value).
+    """
+    # Empty rows / columns do not count towards the degrees of freedom
+    table = psu_totals.sum(axis=0)
+    psu_totals = psu_totals[:, table.sum(axis=1) > 0][:, :, table.sum(axis=0) > 0]
+    n_psu, n_row, n_col = psu_totals.shape
+    df = (n_row - 1) * (n_col - 1)
+    if df == 0 or n_obs == 0:
+        return np.nan, np.nan, np.nan, df, np.nan
+
+    psu_weight = psu_totals.sum(axis=(1, 2))
+    total = psu_weight.sum()
+    cells = psu_totals.reshape(n_psu, -1)
+    margins = np.hstack([cells, psu_totals.sum(axis=2), psu_totals.sum(axis=1)])
+
+    p = margins.sum(axis=0) / total
+    p_cell, p_row, p_col = np.split(p, [n_row * n_col, n_row * n_col + n_row])
+
+    # Linearized variance of each estimated proportion: z = w (y - p) / W per PSU
+    influence = (margins - np.outer(psu_weight, p)) / total
+    variance = design.linearized_variance(influence)
+    srs_variance = p * (1 - p) / n_obs
+    with np.errstate(divide='ignore', invalid='ignore'):
+        deff = np.where(srs_variance > 0, variance / srs_variance, 0.0)
+    d_cell, d_row, d_col = np.split(deff, [n_row * n_col, n_row * n_col + n_row])
+
+    expected = np.outer(p_row, p_col).ravel()
+    pearson = n_obs * ((p_cell - expected) ** 2 / expected).sum()
+    mean_deff = (((1 - p_cell) * d_cell).sum() - ((1 - p_row) * d_row).sum()
+                 - ((1 - p_col) * d_col).sum()) / df
+    if not mean_deff > 0:
+        mean_deff = 1.0
+    corrected = pearson / mean_deff
+    return pearson, mean_deff, corrected, df, chi2_distribution.sf(corrected, df)
+
+
+def survey_chi2_tests(data, variables, outcome, design, rows=None):
+    """
+    Rao-Scott test of every variable against `outcome`, in one pass over the data.
+
+    `rows` (mask or positions) restricts the analysis to a domain such as
+    sexually active women; the full design is kept for the variance.
+    Returns a DataFrame (TEST_COLUMNS) and {variable: weighted crosstab DataFrame}.
+    """
+    if rows is not None:
+        # Only the tested columns are sliced, so wide extracts stay cheap to subset
+        data = data[list(dict.fromkeys(list(variables) + [outcome]))]
+        data = data.iloc[np.flatnonzero(rows)] if np.asarray(rows).dtype == bool else data.iloc[rows]
+        design = design.subset(rows)
+
+    outcome_codes, outcome_levels = category_codes(data[outcome])
+    n_col = len(outcome_levels)
+
+    # One global cell id per (variable, category, outcome level); invalid rows go to a spare bin
+    coded = [category_codes(data[var]) for var in variables]
+    offsets = np.cumsum([0] + [len(levels) * n_col for _, levels in coded])
+    n_cells = offsets[-1]
+    cell_ids = np.full((len(data), len(variables)), n_cells, dtype=np.intp)
+    for j, (codes, _) in enumerate(coded):
+        valid = (codes >= 0) & (outcome_codes >= 0)
+        cell_ids[valid, j] = offsets[j] + codes[valid] * n_col + outcome_codes[valid]
+
+    flat_ids = (design.psu[:, None] * (n_cells + 1) + cell_ids).ravel()
+    weights = np.repeat(design.weights, len(variables))
+    psu_totals = np.bincount(flat_ids, weights=weights,
+                             minlength=design.n_psu * (n_cells + 1)).reshape(design.n_psu, -1)
+    counts = np.bincount(cell_ids.ravel(), minlength=n_cells + 1)
+
+    results, tables = [], {}
+    for j, (var, (_, levels)) in enumerate(zip(variables, coded)):
+        block = psu_totals[:, offsets[j]:offsets[j + 1]].reshape(design.n_psu, len(levels), n_col)
+        n_obs = int(counts[offsets[j]:offsets[j + 1]].sum())
+        pearson, mean_deff, corrected, df, p_value = rao_scott_from_totals(block, n_obs, design)
+        results.append(dict(zip(TEST_COLUMNS, [var, n_obs, df, pearson, mean_deff, corrected, p_value])))
+        tables[var] = pd.DataFrame(block.sum(axis=0), index=pd.Index(levels, name=var),
+                                   columns=pd.Index(outcome_levels, name=outcome))
+
+    return pd.DataFrame(results, columns=TEST_COLUMNS), tables
+
+
+def rao_scott_test(data, var, outcome, design, rows=None):
+    """(corrected chi2, p-value) of a single variable against the outcome"""
+    results, _ = survey_chi2_tests(data, [var], outcome, design, rows)
+    return results.loc[0, 'chi2_rao_scott'], results.loc[0, 'p_value']
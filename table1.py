@@ -0,0 +1,109 @@
+"""
+TABLE 1 BUILDER
+===============
+
+Builds the descriptive "Table 1" (sample characteristics and early sexual
+debut prevalence) with one grouped aggregation per characteristic: each
+variable is coded to integer categories once, and N, sexually active N and
+early debut counts come from `np.bincount` over those codes instead of
+re-filtering the data for every category. The p-value of each
+characteristic is computed rather than typed in: a chi-square test of the
+category x outcome table among sexually active women, or the survey-design
+p-values passed in `p_values` (see survey_stats.py).
+
+Usage:
+    table1_df = build_table1(data, has_sex)
+"""
+
+import numpy as np
+import pandas as pd
+from scipy.stats import chi2_contingency
+
+# (label, column, category order)
+TABLE1_VARIABLES = [
+    ('Age group', 'age_group', ['15-19', '20-24', '25-29', '30-34', '35-39', '40-44', '45-49']),
+    ('Education', 'education_category', ['No education', 'Primary', 'Secondary', 'Higher']),
+    ('Wealth quintile', 'wealth_category', ['Poorest', 'Poorer', 'Middle', 'Richer', 'Richest']),
+    ('Residence', 'residence', ['Rural', 'Urban']),
+]
+
+TABLE1_COLUMNS = ['Characteristic', 'Category', 'N_total', 'Percent_total',
+                  'N_sexually_active', 'Early_debut_pct', 'p_value']
+
+
+def format_p_value(p_value, threshold=0.001):
+    """'<0.001' below the threshold, otherwise three decimals"""
+    if np.isnan(p_value):
+        return ''
+    return f'<{threshold}' if p_value < threshold else f'{p_value:.3f}'
+
+
+def category_codes(values, categories):
+    """Integer codes of `values` in the order of `categories` (-1 for others/missing)"""
+    return pd.Categorical(values, categories=categories).codes.astype(np.intp)
+
+
+def chi_square_p_value(table):
+    """p-value of a chi-square test, ignoring empty rows and columns"""
+    table = table[table.sum(axis=1) > 0][:, table.sum(axis=0) > 0]
+    if min(table.shape) < 2:
+        return np.nan
+    return chi2_contingency(table)[1]
+
+
+def grouped_counts(codes, n_categories, active, outcome):
+    """N, active N, outcome N and outcome sum per category, plus the category x outcome table"""
+    known = codes >= 0
+    scored = known & active & ~np.isnan(outcome)
+
+    n_total = np.bincount(codes[known], minlength=n_categories)
+    n_active = np.bincount(codes[known & active], minlength=n_categories)
+    n_scored = np.bincount(codes[scored], minlength=n_categories)
+    n_positive = np.bincount(codes[scored], weights=outcome[scored], minlength=n_categories)
+    table = np.column_stack([n_scored - n_positive, n_positive])
+    return n_total, n_active, n_scored, n_positive, table
+
+
+def build_table1(data, active, variables=TABLE1_VARIABLES, outcome='early_sexual_debut', p_values=None):
+    """Table 1 as a DataFrame (same layout as Table1_Descriptive_Statistics.csv)
+
+    `p_values` ({column: p}) replaces the unweighted chi-square p-values.
+    """
+    active = np.asarray(active, dtype=bool)
+    outcome_values = data[outcome].to_numpy(dtype=float, na_value=np.nan)
+    n_rows = len(data)
+
+    scored = active & ~np.isnan(outcome_values)
+    rows = [{
+        'Characteristic': 'Total Sample',
+        'Category': '',
+        'N_total': n_rows,
+        'Percent_total': 100.0,
+        'N_sexually_active': int(active.sum()),
+        'Early_debut_pct': outcome_values[scored].mean() * 100,
+        'p_value': '',
+    }]
+
+    for label, column, categories in variables:
+        codes = category_codes(data[column], categories)
+        n_total, n_active, n_scored, n_positive, table = grouped_counts(
+            codes, len(categories), active, outcome_values)
+        if p_values is not None and column in p_values:
+            p_value = format_p_value(p_values[column])
+        else:
+            p_value = format_p_value(chi_square_p_value(table))
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            early_pct = np.where(n_scored > 0, n_positive / n_scored * 100, 0)
+        for i, category in enumerate(categories):
+            rows.append({
+                'Characteristic': label if i == 0 else '',
+                'Category': category,
+                'N_total': int(n_total[i]),
+                'Percent_total': n_total[i] / n_rows * 100,
+                'N_sexually_active': int(n_active[i]),
+                'Early_debut_pct': early_pct[i],
+                'p_value': p_value if i == 0 else '',
+            })
+
+    return pd.DataFrame(rows, columns=TABLE1_COLUMNS)
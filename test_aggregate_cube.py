@@ -0,0 +1,56 @@
+"""Slices of the aggregate cube against direct groupbys of the respondent data"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from aggregate_cube import AggregateCube, cell_index, dimension_levels
+
+PROVINCES = ['Kigali', 'South', 'West', 'North', 'East']
+RESIDENCE = ['Urban', 'Rural']
+SCHEMA = {
+    'v024': {'kind': 'category', 'categories': PROVINCES},
+    'residence': {'kind': 'category', 'categories': RESIDENCE},
+}
+
+
+@pytest.fixture(scope='module')
+def respondents():
+    rng = np.random.default_rng(0)
+    n = 2000
+    data = pd.DataFrame({
+        'v024': rng.choice(PROVINCES, n),
+        'residence': rng.choice(RESIDENCE, n),
+        'weight': rng.uniform(0.5, 2.0, n),
+        'o': rng.integers(0, 2, n).astype(float),
+    })
+    data.loc[rng.random(n) < 0.1, 'o'] = np.nan
+    return data
+
+
+@pytest.fixture(scope='module')
+def cube(respondents):
+    levels = dimension_levels(SCHEMA, ['v024', 'residence'])
+    cube = AggregateCube(levels, ['o'])
+    cube.add(cell_index(respondents, levels, SCHEMA), respondents['weight'].to_numpy(),
+             {'o': respondents['o'].to_numpy()})
+    return cube
+
+
+def expected(data, by):
+    domain = data[data['o'].notna()]
+    rate = (domain['weight'] * domain['o']).groupby([domain[dim] for dim in by]).sum() \
+        / domain.groupby(by)['weight'].sum() * 100
+    return data.groupby(by).size(), rate
+
+
+@pytest.mark.parametrize('selected', ['East', ['East', 'Kigali'], ['East', 'East']])
+def test_where_on_a_by_dimension_matches_groupby(cube, respondents, selected):
+    levels = [selected] if isinstance(selected, str) else selected
+    result = cube.query('o', by=['v024', 'residence'], where={'v024': selected})
+
+    counts, rate = expected(respondents[respondents['v024'].isin(levels)], ['v024', 'residence'])
+    assert set(result.index.get_level_values('v024')) == set(levels)
+    assert result['n'].to_dict() == counts.to_dict()
+    np.testing.assert_allclose(result['rate'], rate.reindex(result.index))
+
@@ -0,0 +1,27 @@
+"""Query service answers for a where dimension that is also grouped by"""
+
+import json
+
+import pytest
+
+from eda_server import QueryService
+from test_aggregate_cube import cube, expected, respondents  # noqa: F401 (fixtures)
+
+
+def test_service_slices_a_dimension_it_groups_by(cube, respondents):
+    service = QueryService(cube)
+    east = respondents[respondents['v024'] == 'East']
+    counts, rate = expected(east, ['v024'])
+
+    payload = json.loads(service.handle('/prevalence', 'outcome=o&by=v024&where=v024:East,v024:East'))
+    assert [(row['v024'], row['n']) for row in payload['rows']] == [('East', counts['East'])]
+    assert payload['rows'][0]['rate'] == pytest.approx(rate['East'])
+
+    payload = json.loads(service.handle('/crosstab', 'rows=v024&cols=residence&where=v024:East'))
+    assert [row['v024'] for row in payload['table']] == ['East']
+    assert payload['table'][0]['Rural'] == east['residence'].eq('Rural').sum()
+
+    payload = json.loads(service.handle('/crosstab', 'rows=residence&cols=v024&where=v024:East,v024:Kigali'))
+    assert sorted(payload['columns']) == ['East', 'Kigali']
+    assert sum(row['East'] + row['Kigali'] for row in payload['table']) == \
+        respondents['v024'].isin(['East', 'Kigali']).sum()
@@ -0,0 +1,141 @@
+"""
+INCREMENTAL RE-VALIDATION KEYED ON CASEID ROW HASHES
+====================================================
+
+Keeps a per-`caseid` store of row hashes and violation bitmaps (one bit per
+rule, see consistency_rules.RULE_BITS) from the last validation run. On the
+next run only rows that are new or whose values changed are re-evaluated;
+results for unchanged rows are merged from the stored violation index.
+
+The store lives next to the dataset cache (`.dhs_cache/<csv>.validation.parquet`)
+and is shared by `check_data_consistency.py` and `cleaning_impossibl_case.py`.
+It is discarded automatically when the rules (consistency_rules.py) change.
+When only the dataset-wide parameters (weight fences) move, just the rules
+that depend on them are re-evaluated for every row.
+"""
+
+import os
+import json
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+import consistency_rules
+from consistency_rules import (RULES, RULE_COLUMNS, PARAM_RULES, BITMAP_DTYPE, MaskContext,
+                               RuleResults, compute_params, evaluate_rules,
+                               evaluate_rules_parallel, rule_mask, rows_from_bits)
+from data_loader import cache_path_for, pq
+from subpopulations import definitions_signature
+
+STORE_SUFFIX = '.validation.parquet'
+SIGNATURE_KEY = b'dhs_validation_signature'
+PARAMS_KEY = b'dhs_validation_params'
+
+
+def store_path_for(csv_path):
+    """Location of the validation store for a dataset CSV"""
+    return cache_path_for(csv_path, STORE_SUFFIX)
+
+
+def rules_signature(rules):
+    """Identify the rule definitions a store was built with"""
+    with open(consistency_rules.__file__, 'rb') as f:
+        source_hash = hashlib.sha1(f.read()).hexdigest()
+    payload = {'source': source_hash, 'subpopulations': definitions_signature(),
+               'rules': [rule.name for rule in rules]}
+    return json.dumps(payload, sort_keys=True)
+
+
+def _params_key(params):
+    return json.dumps({key: float(value) for key, value in params.items()}, sort_keys=True)
+
+
+def row_hashes(data):
+    """64-bit hash of the values every rule looks at, one per row"""
+    columns = [col for col in RULE_COLUMNS if col in data.columns]
+    return pd.util.hash_pandas_object(data[columns], index=False).to_numpy()
+
+
+def load_store(store_path, signature):
+    """Previous run's (store, params key), or (None, None) if missing or built with other rules"""
+    if pq is None or not os.path.exists(store_path):
+        return None, None
+    try:
+        metadata = pq.read_schema(store_path).metadata or {}
+        if metadata.get(SIGNATURE_KEY, b'').decode('utf-8') != signature:
+            return None, None
+        return pd.read_parquet(store_path), metadata.get(PARAMS_KEY, b'').decode('utf-8')
+    except Exception:
+        return None, None
+
+
+def save_store(store_path, caseids, hashes, bits, signature, params):
+    """Write caseid, row hash and violation bitmap"""
+    if pq is None:
+        return
+    import pyarrow as pa
+
+    store = pd.DataFrame({'caseid': caseids, 'row_hash': hashes, 'violation_bits': bits})
+
+    table = pa.Table.from_pandas(store, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[SIGNATURE_KEY] = signature.encode('utf-8')
+    metadata[PARAMS_KEY] = _params_key(params).encode('utf-8')
+    table = table.replace_schema_metadata(metadata)
+
+    os.makedirs(os.path.dirname(store_path), exist_ok=True)
+    tmp_file = store_path + f'.tmp{os.getpid()}'
+    pq.write_table(table, tmp_file)
+    os.replace(tmp_file, store_path)
+
+
+def incremental_evaluate(data, store_path, rules=RULES, workers=1, shard_by='v001', full=False):
+    """
+    Evaluate rules, re-checking only rows whose caseid is new or whose values changed.
+
+    Returns (RuleResults, n_evaluated). Falls back to a full evaluation when
+    there is no usable store, caseids are not unique or `full` is set; the
+    store is rewritten in every case.
+    """
+    params = compute_params(data)
+    signature = rules_signature(rules)
+    caseids = data['caseid'].to_numpy()
+    hashes = row_hashes(data)
+    n_rows = len(data)
+
+    store, stored_params = (None, None) if full else load_store(store_path, signature)
+    unchanged = np.zeros(n_rows, dtype=bool)
+    if store is not None and data['caseid'].is_unique and store['caseid'].is_unique:
+        previous = pd.Index(store['caseid']).get_indexer(caseids)
+        known = previous >= 0
+        unchanged[known] = store['row_hash'].to_numpy()[previous[known]] == hashes[known]
+
+    changed_rows = np.flatnonzero(~unchanged)
+    bits = np.zeros(n_rows, dtype=BITMAP_DTYPE)
+
+    # Unchanged rows: copy last run's bitmap
+    if unchanged.any():
+        bits[unchanged] = store['violation_bits'].to_numpy()[previous[unchanged]]
+
+    # New or changed rows: evaluate (global params keep rules like weight fences consistent)
+    if len(changed_rows):
+        subset = data.iloc[changed_rows]
+        if workers > 1:
+            fresh = evaluate_rules_parallel(subset, workers=workers, shard_by=shard_by,
+                                            rules=rules, params=params)
+        else:
+            fresh = evaluate_rules(subset, rules, params)
+        bits[changed_rows] = fresh.bits
+
+    # Weight fences moved: re-check the rules that depend on them for every row
+    param_rules = [rule for rule in rules if rule.name in PARAM_RULES]
+    if unchanged.any() and param_rules and stored_params != _params_key(params):
+        refreshed = evaluate_rules(data, param_rules, params)
+        param_bits = rule_mask(*[rule.name for rule in param_rules])
+        bits = (bits & ~param_bits) | refreshed.bits
+
+    save_store(store_path, caseids, hashes, bits, signature, params)
+
+    results = RuleResults(rows_from_bits(bits, rules), MaskContext(data, params), rules, bits)
+    return results, len(changed_rows)